@@ -0,0 +1,194 @@
+"""
+Measures the throughput, the deep copies and the peak memory allocated per
+message along the path of a system's data, from the System
+Monitor processing the node exporter metrics to the System Data Transformer
+publishing the data for alerting and storage. RabbitMQ is replaced by a stub
+which serialises published messages, so only the processing done by PANIC is
+measured.
+
+Usage, from the alerter directory:
+    python -m benchmarks.message_path [--messages N] [--cpus N ...]
+
+The metrics are modelled on the output of node exporter 1.x on a host with
+the given number of CPUs (2 and 64 by default).
+"""
+import argparse
+import copy
+import itertools
+import json
+import logging
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Callable, Dict, Tuple
+
+from src.configs.system import SystemConfig
+from src.data_store.redis import RedisApi
+from src.data_transformers.system import SystemDataTransformer
+from src.monitorables.system import System
+from src.monitors.system import SystemMonitor
+
+_FILESYSTEMS = [('/dev/sda1', 'ext4', '/'), ('/dev/sda2', 'ext4', '/home'),
+                ('tmpfs', 'tmpfs', '/run'), ('tmpfs', 'tmpfs', '/run/lock'),
+                ('/dev/nvme0n1p1', 'xfs', '/var/lib/docker')]
+_CPU_MODES = ['idle', 'iowait', 'irq', 'nice', 'softirq', 'steal', 'system',
+              'user']
+
+
+_deepcopy = copy.deepcopy
+_deepcopy_calls = [0]
+
+
+def _counting_deepcopy(x, memo=None, _nil=[]):
+    _deepcopy_calls[0] += 1
+    return _deepcopy(x, memo, _nil)
+
+
+class _StubRabbitMQ:
+    # Serialises messages like RabbitMQApi.basic_publish, without sending them
+    def __init__(self) -> None:
+        self.published = 0
+
+    def basic_publish_confirm(self, exchange: str, routing_key: str, body,
+                              is_body_dict: bool = False, properties=None,
+                              mandatory: bool = False) -> None:
+        json.dumps(body) if is_body_dict else body
+        self.published += 1
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False) -> None:
+        pass
+
+
+def generate_retrieved_metrics(cpus: int) -> Dict:
+    # The metrics returned by get_prometheus_metrics_data for the monitor
+    return {
+        'go_memstats_alloc_bytes': 2003024.0,
+        'go_memstats_alloc_bytes_total': 435777412600.0,
+        'node_cpu_seconds_total': {
+            json.dumps({'cpu': str(cpu), 'mode': mode}): 1000.0 * (cpu + 1)
+            for cpu in range(cpus) for mode in _CPU_MODES
+        },
+        'node_disk_io_time_seconds_total': {
+            json.dumps({'device': device}): 38288.0
+            for device in ['dm-0', 'nvme0n1', 'sda', 'sdb']
+        },
+        'node_filesystem_avail_bytes': {
+            json.dumps({'device': device, 'fstype': fstype,
+                        'mountpoint': mountpoint}): 57908170752.0
+            for device, fstype, mountpoint in _FILESYSTEMS
+        },
+        'node_filesystem_size_bytes': {
+            json.dumps({'device': device, 'fstype': fstype,
+                        'mountpoint': mountpoint}): 104560844800.0
+            for device, fstype, mountpoint in _FILESYSTEMS
+        },
+        'node_memory_MemAvailable_bytes': 1377767424.0,
+        'node_memory_MemTotal_bytes': 2090237952.0,
+        'node_network_receive_bytes_total': {
+            json.dumps({'device': device}): 722358765622.0
+            for device in ['docker0', 'eth0', 'eth1', 'lo']
+        },
+        'node_network_transmit_bytes_total': {
+            json.dumps({'device': device}): 1011571824152.0
+            for device in ['docker0', 'eth0', 'eth1', 'lo']
+        },
+        'process_cpu_seconds_total': 2786.82,
+        'process_max_fds': 1024.0,
+        'process_open_fds': 8.0,
+        'process_virtual_memory_bytes': 118513664.0,
+    }
+
+
+def _create_components() -> Tuple[SystemMonitor, SystemDataTransformer]:
+    logger = logging.getLogger('benchmark')
+    logger.disabled = True
+    rabbitmq = _StubRabbitMQ()
+    system_config = SystemConfig('system_id', 'parent_id', 'system_name',
+                                 True, 'http://localhost:9100/metrics')
+    monitor = SystemMonitor('System monitor (system_name)', system_config,
+                            logger, 60, rabbitmq)
+    redis = RedisApi(logger, 0)
+    transformer = SystemDataTransformer('System Data Transformer', logger,
+                                        redis, rabbitmq, 1000)
+
+    # The state is already loaded, as after the first message of a system
+    system = System('system_name', 'system_id', 'parent_id')
+    system.set_last_monitored(time.time() - 60)
+    system.set_network_transmit_bytes_total(1011571000000.0)
+    system.set_network_receive_bytes_total(722358000000.0)
+    system.set_disk_io_time_seconds_total(38000.0)
+    transformer.state['system_id'] = system
+    return monitor, transformer
+
+
+def _measure(process_message: Callable[[], None], messages: int) \
+        -> Dict[str, float]:
+    # Returns the messages processed per second, together with the deep
+    # copies made and the peak memory in bytes allocated while processing a
+    # message
+    start = time.perf_counter()
+    for _ in range(messages):
+        process_message()
+    results = {'rate': messages / (time.perf_counter() - start)}
+
+    _deepcopy_calls[0] = 0
+    copy.deepcopy = _counting_deepcopy
+    try:
+        process_message()
+    finally:
+        copy.deepcopy = _deepcopy
+    results['copies'] = _deepcopy_calls[0]
+
+    samples = min(messages, 100)
+    allocated = 0
+    for _ in range(samples):
+        tracemalloc.start()
+        process_message()
+        allocated += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    results['allocated'] = allocated / samples
+    return results
+
+
+def run(cpus: int, messages: int) -> None:
+    monitor, transformer = _create_components()
+    metrics = generate_retrieved_metrics(cpus)
+    method = SimpleNamespace(delivery_tag=1)
+    message = monitor._process_retrieved_data(metrics)
+    monitoring_times = itertools.count(message['result']['meta_data']['time'])
+
+    def monitor_message() -> None:
+        json.dumps(monitor._process_retrieved_data(metrics))
+
+    def transformer_message() -> None:
+        # Every message is from a later monitoring round than the previous
+        message['result']['meta_data']['time'] = next(monitoring_times)
+        body = json.dumps(message).encode()
+        transformer._process_raw_data(None, method, None, body)
+
+    print("{} CPUs ({} node_cpu_seconds_total samples):".format(
+        cpus, len(metrics['node_cpu_seconds_total'])))
+    for stage, process_message in [('System Monitor', monitor_message),
+                                   ('System Data Transformer',
+                                    transformer_message)]:
+        results = _measure(process_message, messages)
+        print("  {:<24} {:>7.0f} msgs/s, per message: {} deep copies, "
+              "{:.0f} bytes peak allocation".format(
+                stage, results['rate'], results['copies'],
+                results['allocated']))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--messages', type=int, default=20000,
+                        help='the number of messages to process per stage')
+    parser.add_argument('--cpus', type=int, nargs='*', default=[2, 64],
+                        help='the number of CPUs of the monitored hosts')
+    args = parser.parse_args()
+
+    for cpus in args.cpus:
+        run(cpus, args.messages)
+
+
+if __name__ == '__main__':
+    main()
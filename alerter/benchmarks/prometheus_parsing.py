@@ -0,0 +1,204 @@
+"""
+Compares the time taken to extract the metrics needed by the system monitor
+from a node exporter page, using the prometheus_client parser (which was used
+before) and the selective streaming parser in src.utils.data.
+
+Usage, from the alerter directory:
+    python -m benchmarks.prometheus_parsing [--repeat N] [FILE ...]
+
+FILE is a page recorded from a node exporter, for example using
+    curl -s http://<node_ip>:9100/metrics > node.prom
+If no file is given, pages modelled on the output of a small (2 CPUs) and a
+large (64 CPUs) host running node exporter 1.x are generated.
+"""
+import argparse
+import json
+import timeit
+from typing import Dict, List
+
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.utils.data import parse_prometheus_metrics
+
+# The metrics requested by the system monitor
+REQUESTED_METRICS = ['process_cpu_seconds_total', 'go_memstats_alloc_bytes',
+                     'go_memstats_alloc_bytes_total',
+                     'process_virtual_memory_bytes', 'process_max_fds',
+                     'process_open_fds', 'node_cpu_seconds_total',
+                     'node_filesystem_avail_bytes',
+                     'node_filesystem_size_bytes',
+                     'node_memory_MemTotal_bytes',
+                     'node_memory_MemAvailable_bytes',
+                     'node_network_transmit_bytes_total',
+                     'node_network_receive_bytes_total',
+                     'node_disk_io_time_seconds_total']
+
+_CPU_MODES = ['idle', 'iowait', 'irq', 'nice', 'softirq', 'steal', 'system',
+              'user']
+_DISKS = ['nvme0n1', 'sda', 'sdb']
+_NETWORK_DEVICES = ['docker0', 'eth0', 'eth1', 'lo']
+_FILESYSTEMS = [('/dev/sda1', 'ext4', '/'), ('/dev/sda2', 'ext4', '/home'),
+                ('tmpfs', 'tmpfs', '/run'), ('tmpfs', 'tmpfs', '/run/lock'),
+                ('/dev/nvme0n1p1', 'xfs', '/var/lib/docker')]
+_MEMORY_FIELDS = ['Active', 'Active_anon', 'Buffers', 'Cached', 'CommitLimit',
+                  'Committed_AS', 'Dirty', 'Inactive', 'Mapped',
+                  'MemAvailable', 'MemFree', 'MemTotal', 'Shmem', 'Slab',
+                  'SwapCached', 'SwapFree', 'SwapTotal', 'VmallocTotal',
+                  'Writeback']
+_DISK_COUNTERS = ['discard_time_seconds_total', 'discarded_sectors_total',
+                  'io_now', 'io_time_seconds_total',
+                  'io_time_weighted_seconds_total', 'read_bytes_total',
+                  'read_time_seconds_total', 'reads_completed_total',
+                  'reads_merged_total', 'write_time_seconds_total',
+                  'writes_completed_total', 'writes_merged_total',
+                  'written_bytes_total']
+_NETWORK_COUNTERS = ['receive_bytes_total', 'receive_compressed_total',
+                     'receive_drop_total', 'receive_errs_total',
+                     'receive_fifo_total', 'receive_frame_total',
+                     'receive_multicast_total', 'receive_packets_total',
+                     'transmit_bytes_total', 'transmit_carrier_total',
+                     'transmit_colls_total', 'transmit_compressed_total',
+                     'transmit_drop_total', 'transmit_errs_total',
+                     'transmit_fifo_total', 'transmit_packets_total']
+_INTERRUPTS = ['0', '1', '8', '9', '12', '16', '120', '121', '122', 'LOC',
+               'NMI', 'PMI', 'RES', 'CAL', 'TLB', 'MCE', 'MCP']
+
+
+def _family(lines: List[str], name: str, metric_type: str,
+            samples: List[str]) -> None:
+    lines.append('# HELP {} {} metric.'.format(name, metric_type))
+    lines.append('# TYPE {} {}'.format(name, metric_type))
+    lines.extend(samples)
+
+
+def generate_node_exporter_page(cpus: int) -> str:
+    # The families are sorted by name, like in the node exporter output
+    families = {}
+    families['go_goroutines'] = ('gauge', ['go_goroutines 8'])
+    for name, value in [('alloc_bytes', '3.51e+06'),
+                        ('alloc_bytes_total', '1.27e+11'),
+                        ('heap_inuse_bytes', '5.2e+06'),
+                        ('sys_bytes', '7.4e+07')]:
+        families['go_memstats_' + name] = (
+            'gauge', ['go_memstats_{} {}'.format(name, value)])
+    families['go_gc_duration_seconds'] = ('summary', [
+        'go_gc_duration_seconds{{quantile="{}"}} 3.1e-05'.format(quantile)
+        for quantile in ['0', '0.25', '0.5', '0.75', '1']] + [
+        'go_gc_duration_seconds_sum 12.45',
+        'go_gc_duration_seconds_count 182764'])
+    families['node_cpu_seconds_total'] = ('counter', [
+        'node_cpu_seconds_total{{cpu="{}",mode="{}"}} {}'.format(
+            cpu, mode, 1000.5 * (cpu + 1))
+        for cpu in range(cpus) for mode in _CPU_MODES])
+    families['node_cpu_guest_seconds_total'] = ('counter', [
+        'node_cpu_guest_seconds_total{{cpu="{}",mode="{}"}} 0'.format(
+            cpu, mode)
+        for cpu in range(cpus) for mode in ['nice', 'user']])
+    for counter in _DISK_COUNTERS:
+        families['node_disk_' + counter] = ('counter', [
+            'node_disk_{}{{device="{}"}} 7.3512e+06'.format(counter, disk)
+            for disk in _DISKS])
+    for name in ['avail_bytes', 'files', 'files_free', 'free_bytes',
+                 'readonly', 'size_bytes']:
+        families['node_filesystem_' + name] = ('gauge', [
+            'node_filesystem_{}{{device="{}",fstype="{}",mountpoint="{}"}} '
+            '2.0897e+10'.format(name, device, fstype, mountpoint)
+            for device, fstype, mountpoint in _FILESYSTEMS])
+    families['node_interrupts_total'] = ('counter', [
+        'node_interrupts_total{{cpu="{}",devices="",info="",type="{}"}} '
+        '{}'.format(cpu, interrupt, 12345 * cpu)
+        for cpu in range(cpus) for interrupt in _INTERRUPTS])
+    for load in ['1', '5', '15']:
+        families['node_load' + load] = ('gauge',
+                                        ['node_load{} 0.52'.format(load)])
+    for field in _MEMORY_FIELDS:
+        families['node_memory_{}_bytes'.format(field)] = (
+            'gauge', ['node_memory_{}_bytes 8.2532e+09'.format(field)])
+    for counter in _NETWORK_COUNTERS:
+        families['node_network_' + counter] = ('counter', [
+            'node_network_{}{{device="{}"}} 9.8143e+08'.format(counter,
+                                                               device)
+            for device in _NETWORK_DEVICES])
+    families['node_schedstat_running_seconds_total'] = ('counter', [
+        'node_schedstat_running_seconds_total{{cpu="{}"}} 3.4e+05'.format(cpu)
+        for cpu in range(cpus)])
+    families['node_softnet_processed_total'] = ('counter', [
+        'node_softnet_processed_total{{cpu="{}"}} 4.4e+07'.format(cpu)
+        for cpu in range(cpus)])
+    for name, value in [('cpu_seconds_total', '1863.51'),
+                        ('max_fds', '1.048576e+06'), ('open_fds', '9'),
+                        ('resident_memory_bytes', '2.1e+07'),
+                        ('virtual_memory_bytes', '7.3e+08')]:
+        families['process_' + name] = ('gauge',
+                                       ['process_{} {}'.format(name, value)])
+    families['promhttp_metric_handler_requests_total'] = ('counter', [
+        'promhttp_metric_handler_requests_total{{code="{}"}} 0'.format(code)
+        for code in ['200', '500', '503']])
+
+    lines = []
+    for name in sorted(families):
+        metric_type, samples = families[name]
+        _family(lines, name, metric_type, samples)
+    return '\n'.join(lines) + '\n'
+
+
+def prometheus_client_parse(text: str, requested_metrics: List[str]) -> Dict:
+    response = {}
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if sample.name not in requested_metrics:
+                continue
+            if sample.labels != {}:
+                if sample.name not in response:
+                    response[sample.name] = {}
+                response[sample.name][json.dumps(sample.labels)] = \
+                    sample.value
+            elif sample.name not in response:
+                response[sample.name] = sample.value
+            else:
+                response[sample.name] = sample.value + response[sample.name]
+    return response
+
+
+def streaming_parse(text: str, requested_metrics: List[str]) -> Dict:
+    return parse_prometheus_metrics(text.splitlines(), requested_metrics)
+
+
+def benchmark(name: str, text: str, repeat: int) -> None:
+    expected = prometheus_client_parse(text, REQUESTED_METRICS)
+    if streaming_parse(text, REQUESTED_METRICS) != expected:
+        raise ValueError("The parsers disagree on {}".format(name))
+
+    print("{}: {} lines, {} bytes".format(name, text.count('\n'), len(text)))
+    timings = {}
+    for parser in [prometheus_client_parse, streaming_parse]:
+        timings[parser] = min(timeit.repeat(
+            lambda: parser(text, REQUESTED_METRICS), number=repeat,
+            repeat=5)) / repeat
+        print("  {:<24} {:8.3f} ms/page".format(parser.__name__,
+                                                timings[parser] * 1000))
+    print("  speedup: {:.1f}x".format(
+        timings[prometheus_client_parse] / timings[streaming_parse]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('files', nargs='*',
+                        help="Pages recorded from node exporters")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="Number of parses per timing")
+    args = parser.parse_args()
+
+    if args.files:
+        for file in args.files:
+            with open(file, 'r') as f:
+                benchmark(file, f.read(), args.repeat)
+    else:
+        benchmark('generated 2 CPUs page', generate_node_exporter_page(2),
+                  args.repeat)
+        benchmark('generated 64 CPUs page', generate_node_exporter_page(64),
+                  args.repeat)
+
+
+if __name__ == '__main__':
+    main()
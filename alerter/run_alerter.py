@@ -140,7 +140,8 @@ def _initialise_system_monitors_manager() -> SystemMonitorsManager:
                 logger=system_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
             system_monitors_manager = SystemMonitorsManager(
-                system_monitors_manager_logger, manager_display_name, rabbitmq)
+                system_monitors_manager_logger, manager_display_name, rabbitmq,
+                env.MULTIPLEX_SYSTEM_MONITORS)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -169,7 +170,8 @@ def _initialise_github_monitors_manager() -> GitHubMonitorsManager:
                 logger=github_monitors_manager_logger.getChild(
                     RabbitMQApi.__name__), host=rabbit_ip)
             github_monitors_manager = GitHubMonitorsManager(
-                github_monitors_manager_logger, manager_display_name, rabbitmq)
+                github_monitors_manager_logger, manager_display_name, rabbitmq,
+                env.USE_GITHUB_GRAPHQL_API)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -1,13 +1,15 @@
-import copy
+import json
 import logging
 from abc import ABC, abstractmethod
 from queue import Queue
-from typing import Dict
+from typing import Dict, Optional
 
 from pika import BasicProperties
 
 from src.abstract import Component
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.pipelined_publisher import (
+    PipelinedPublisher)
 
 
 class PublisherSubscriberComponent(Component, ABC):
@@ -65,14 +67,20 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
     """
 
     def __init__(self, logger: logging.Logger, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0):
+                 max_queue_size: int = 0, confirms_window_size: int = 0):
         """
         Initializes the queue needed for publishing.
         :param logger: The logger object to log with
         :param rabbitmq: The rabbit MQ connection to use
         :param max_queue_size: The max queue size, defaults to 0 for infinite
+        :param confirms_window_size: The maximum number of published messages
+        waiting for a confirm. Defaults to 0, in which case every message is
+        confirmed before publishing the next one
         """
         self._publishing_queue = Queue(max_queue_size)
+        self._pipelined_publisher = PipelinedPublisher(
+            logger, rabbitmq, confirms_window_size) \
+            if confirms_window_size > 0 else None
 
         super().__init__(logger, rabbitmq)
 
@@ -80,12 +88,18 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
     def publishing_queue(self) -> Queue:
         return self._publishing_queue
 
+    @property
+    def pipelined_publisher(self) -> Optional[PipelinedPublisher]:
+        return self._pipelined_publisher
+
     def _push_to_queue(self, data: Dict, exchange: str, routing_key: str,
                        properties: BasicProperties = BasicProperties(
                            delivery_mode=2), mandatory: bool = True) -> None:
         """
         Method that takes the data to save and puts the data in their respective
-        queues
+        queues. The data is serialised once when it is queued, so the queued
+        message is not affected if the data is changed afterwards and no copy
+        of the data is needed.
         :param data: The data to queue to be sent.
         :param exchange: The exchange to send the data to
         :param routing_key: The routing key to use
@@ -102,7 +116,7 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
             self._logger.debug("The queue is full, clearing the first item.")
             self._publishing_queue.get()
         data_dict = {'exchange': exchange, 'routing_key': routing_key,
-                     'data': copy.deepcopy(data), 'properties': properties,
+                     'data': json.dumps(data), 'properties': properties,
                      'mandatory': mandatory}
         self._logger.debug("Adding %s to the queue", data_dict)
         self._publishing_queue.put(data_dict)
@@ -110,6 +124,10 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         self._logger.debug("Data added to the publishing queue successfully.")
 
     def _send_data(self) -> None:
+        if self._pipelined_publisher is not None:
+            self._pipelined_publisher.send_data(self._publishing_queue)
+            return
+
         empty = True
         if not self._publishing_queue.empty():
             empty = False
@@ -124,7 +142,7 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
             try:
                 self._rabbitmq.basic_publish_confirm(
                     exchange=data['exchange'], routing_key=data['routing_key'],
-                    body=data['data'], is_body_dict=True,
+                    body=data['data'], is_body_dict=False,
                     properties=data['properties'], mandatory=data['mandatory'])
                 self._logger.debug(
                     "Sent %s to '%s' exchange", data['data'], data['exchange']
@@ -48,7 +48,8 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
 
         super().__init__(logger, RabbitMQApi(
             logger=logger.getChild(RabbitMQApi.__name__), host=rabbit_ip),
-                         env.ALERT_ROUTER_PUBLISHING_QUEUE_SIZE)
+                         env.ALERT_ROUTER_PUBLISHING_QUEUE_SIZE,
+                         env.PUBLISHER_CONFIRMS_WINDOW_SIZE)
 
     def __str__(self) -> str:
         return self.name
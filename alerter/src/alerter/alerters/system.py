@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 from datetime import datetime, timedelta
@@ -509,7 +508,7 @@ class SystemAlerter(Alerter):
             self.publishing_queue.put({
                 'exchange': ALERT_EXCHANGE,
                 'routing_key': 'alert_router.system',
-                'data': copy.deepcopy(alert),
+                'data': json.dumps(alert),
                 'properties': pika.BasicProperties(delivery_mode=2),
                 'mandatory': True})
             self.logger.debug("%s added to the publishing queue successfully.",
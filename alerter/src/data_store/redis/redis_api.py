@@ -1,7 +1,7 @@
 import distutils.util
 import logging
 from datetime import timedelta
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Callable, Tuple
 
 import redis
 
@@ -139,31 +139,120 @@ class RedisApi:
         else:
             return time_to_live
 
+    @staticmethod
+    def _parse_value(value: Optional[bytes],
+                     default: Optional[bytes] = None) -> Optional[bytes]:
+        # Redis returns None for unset keys, in which case the default is
+        # returned. None values are stored as the string 'None'.
+        if value is None:
+            return default
+        elif value == b'None':
+            return None
+        else:
+            return value
+
     def get_unsafe(self, key: str, default: Optional[bytes] = None) \
             -> Optional[bytes]:
         key = self._add_namespace(key)
 
-        if self.exists_unsafe(key):
-            get_ret = self._redis.get(key)
-            if get_ret.decode('UTF-8') == 'None':
-                return None
-            else:
-                return get_ret
-        else:
-            return default
+        get_ret = self._redis.get(key)
+        return self._parse_value(get_ret, default)
 
     def hget_unsafe(self, name: str, key: str,
                     default: Optional[bytes] = None) -> Optional[bytes]:
         name = self._add_namespace(name)
 
-        if self.hexists_unsafe(name, key):
-            get_ret = self._redis.hget(name, key)
-            if get_ret.decode('UTF-8') == 'None':
-                return None
-            else:
-                return get_ret
+        get_ret = self._redis.hget(name, key)
+        return self._parse_value(get_ret, default)
+
+    def mget_unsafe(self, keys: List[str]) -> Dict[str, Optional[bytes]]:
+        # Gets the values of the given keys in a single round trip. Only the
+        # keys which are set are returned.
+        namespaced_keys = [self._add_namespace(k) for k in keys]
+
+        values = self._redis.mget(namespaced_keys)
+        return {
+            key: self._parse_value(value)
+            for key, value in zip(keys, values) if value is not None
+        }
+
+    def hmget_unsafe(self, name: str, keys: List[str]) \
+            -> Dict[str, Optional[bytes]]:
+        # Gets the values of the given keys of the hash in a single round trip.
+        # Only the keys which exist in the hash are returned.
+        name = self._add_namespace(name)
+
+        values = self._redis.hmget(name, keys)
+        return {
+            key: self._parse_value(value)
+            for key, value in zip(keys, values) if value is not None
+        }
+
+    def hgetall_unsafe(self, name: str) -> Dict[str, Optional[bytes]]:
+        name = self._add_namespace(name)
+
+        # Decode the keys and keep the values as returned by hget
+        values = self._redis.hgetall(name)
+        return {
+            key.decode('UTF-8'): self._parse_value(value)
+            for key, value in values.items()
+        }
+
+    def _queue_batch_command(self, pipe: redis.client.Pipeline, command: str,
+                             args: List[Any]) -> Callable[[Any], Any]:
+        # Queues the command on the pipeline, and returns the function which
+        # converts the command's reply in the same way as the unsafe method
+        # of the same name.
+        if command == 'get':
+            key, default = (list(args) + [None])[:2]
+            pipe.get(self._add_namespace(key))
+            return lambda value: self._parse_value(value, default)
+        elif command == 'hget':
+            name, key, default = (list(args) + [None])[:3]
+            pipe.hget(self._add_namespace(name), key)
+            return lambda value: self._parse_value(value, default)
+        elif command == 'mget':
+            keys = args[0]
+            pipe.mget([self._add_namespace(k) for k in keys])
+            return lambda values: {
+                key: self._parse_value(value)
+                for key, value in zip(keys, values) if value is not None
+            }
+        elif command == 'hmget':
+            name, keys = args
+            pipe.hmget(self._add_namespace(name), keys)
+            return lambda values: {
+                key: self._parse_value(value)
+                for key, value in zip(keys, values) if value is not None
+            }
+        elif command == 'hgetall':
+            pipe.hgetall(self._add_namespace(args[0]))
+            return lambda values: {
+                key.decode('UTF-8'): self._parse_value(value)
+                for key, value in values.items()
+            }
+        elif command == 'exists':
+            pipe.exists(self._add_namespace(args[0]))
+            return bool
+        elif command == 'hexists':
+            name, key = args
+            pipe.hexists(self._add_namespace(name), key)
+            return bool
         else:
-            return default
+            raise ValueError(
+                "Command {} cannot be executed in a batch".format(command))
+
+    def execute_batch_unsafe(self, commands: List[Tuple[str, List[Any]]]) \
+            -> List[Any]:
+        # Executes the given commands in a single round trip. Each command is
+        # given as the name of one of the get, hget, mget, hmget, hgetall,
+        # exists and hexists methods together with the arguments of the
+        # method, and its result is the value the method would return.
+        pipe = self._redis.pipeline(transaction=False)
+        converters = [self._queue_batch_command(pipe, command, args)
+                      for command, args in commands]
+        exec_ret = pipe.execute()
+        return [convert(value) for convert, value in zip(converters, exec_ret)]
 
     def get_int_unsafe(self, key: str, default: Optional[int] = None) \
             -> Optional[int]:
@@ -268,6 +357,19 @@ class RedisApi:
             -> Optional[bytes]:
         return self._safe(self.hget_unsafe, [name, key, default], default)
 
+    def mget(self, keys: List[str]) -> Dict[str, Optional[bytes]]:
+        return self._safe(self.mget_unsafe, [keys], {})
+
+    def hmget(self, name: str, keys: List[str]) -> Dict[str, Optional[bytes]]:
+        return self._safe(self.hmget_unsafe, [name, keys], {})
+
+    def hgetall(self, name: str) -> Dict[str, Optional[bytes]]:
+        return self._safe(self.hgetall_unsafe, [name], {})
+
+    def execute_batch(self, commands: List[Tuple[str, List[Any]]]) \
+            -> Optional[List[Any]]:
+        return self._safe(self.execute_batch_unsafe, [commands], None)
+
     def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
         return self._safe(self.get_int_unsafe, [key, default], default)
 
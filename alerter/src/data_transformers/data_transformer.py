@@ -21,12 +21,14 @@ from src.utils.logging import log_and_print
 class DataTransformer(QueuingPublisherSubscriberComponent):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 confirms_window_size: int = 0) -> None:
         self._transformer_name = transformer_name
         self._redis = redis
         self._state = {}
 
-        super().__init__(logger, rabbitmq, max_queue_size)
+        super().__init__(logger, rabbitmq, max_queue_size,
+                         confirms_window_size)
 
     def __str__(self) -> str:
         return self.transformer_name
@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 from datetime import datetime
@@ -27,9 +26,10 @@ GITHUB_DT_INPUT_ROUTING_KEY = 'github'
 class GitHubDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 confirms_window_size: int = 0) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, confirms_window_size)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -152,14 +152,14 @@ class GitHubDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {
                         'no_of_releases': no_of_releases
                     }
                 }
             }
         elif 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
@@ -180,7 +180,7 @@ class GitHubDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -199,10 +199,9 @@ class GitHubDataTransformer(DataTransformer):
                 repo.no_of_releases
 
             # Finally add the list of releases
-            processed_data_metrics['releases'] = \
-                copy.deepcopy(td_metrics['releases'])
+            processed_data_metrics['releases'] = td_metrics['releases']
         elif 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_alerting".format(self))
@@ -214,13 +213,35 @@ class GitHubDataTransformer(DataTransformer):
     def _transform_data(self, data: Dict) -> Tuple[Dict, Dict, Dict]:
         self.logger.debug("Performing data transformation on %s ...", data)
 
-        if 'result' in data:
+        if 'result' in data and data['result'].get('unchanged', False):
+            meta_data = data['result']['meta_data']
+            repo = self.state[meta_data['repo_id']]
+
+            transformed_data = {
+                'result': {
+                    'meta_data': dict(meta_data),
+                    'data': {},
+                }
+            }
+            td_meta_data = transformed_data['result']['meta_data']
+            td_metrics = transformed_data['result']['data']
+
+            del td_meta_data['monitor_name']
+            del td_meta_data['time']
+            td_meta_data['last_monitored'] = meta_data['time']
+
+            # The monitor does not re-send the releases if they did not
+            # change, therefore keep the number of releases in the state. No
+            # releases are sent, as there are no new releases to alert on.
+            td_metrics['no_of_releases'] = repo.no_of_releases
+            td_metrics['releases'] = {}
+        elif 'result' in data:
             meta_data = data['result']['meta_data']
             repo_metrics = data['result']['data']
 
             transformed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(meta_data),
+                    'meta_data': dict(meta_data),
                     'data': {},
                 }
             }
@@ -236,11 +257,14 @@ class GitHubDataTransformer(DataTransformer):
             # Transform the data by adding the no_of_releases and releases
             # metrics.
             td_metrics['no_of_releases'] = len(repo_metrics)
-            td_metrics['releases'] = copy.deepcopy(repo_metrics)
+            td_metrics['releases'] = repo_metrics
         elif 'error' in data:
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = {
+                'error': {**data['error'],
+                          'meta_data': dict(data['error']['meta_data'])}
+            }
             del transformed_data['error']['meta_data']['monitor_name']
         else:
             raise ReceivedUnexpectedDataException(
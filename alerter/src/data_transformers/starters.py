@@ -81,7 +81,8 @@ def _initialise_data_transformer(data_transformer_type: Type[T],
                 host=env.RABBIT_IP)
             data_transformer = data_transformer_type(
                 data_transformer_display_name, transformer_logger, redis,
-                rabbitmq, env.DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE)
+                rabbitmq, env.DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE,
+                env.PUBLISHER_CONFIRMS_WINDOW_SIZE)
             log_and_print("Successfully initialised {}".format(
                 data_transformer_display_name), transformer_logger)
             break
@@ -98,6 +99,8 @@ def _initialise_data_transformer(data_transformer_type: Type[T],
 def start_system_data_transformer() -> None:
     system_data_transformer = _initialise_data_transformer(
         SystemDataTransformer, SYSTEM_DATA_TRANSFORMER_NAME)
+    if env.PRE_HYDRATE_SYSTEM_TRANSFORMER_STATE:
+        system_data_transformer.pre_hydrate_state()
     start_transformer(system_data_transformer)
 
 
@@ -1,8 +1,7 @@
-import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Union, Tuple
+from typing import Dict, Union, Tuple, List, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -27,9 +26,18 @@ SYSTEM_DT_INPUT_ROUTING_KEY = 'system'
 class SystemDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 confirms_window_size: int = 0) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, confirms_window_size)
+
+        # The keys of every parent hash loaded by pre_hydrate_state which were
+        # not yet used to load the state of a system, indexed by hash name
+        self._pre_hydrated_hashes = {}
+
+    @property
+    def pre_hydrated_hashes(self) -> Dict[str, Dict[str, Optional[bytes]]]:
+        return self._pre_hydrated_hashes
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -70,6 +78,34 @@ class SystemDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
+    def pre_hydrate_state(self) -> None:
+        """
+        Loads every parent hash with one HGETALL each, so that after a restart
+        the state of the systems can be loaded without going to Redis once per
+        system. If Redis is down, the state of each system is loaded from
+        Redis when the system is first seen.
+        """
+        self.logger.info("Pre-hydrating the state of the systems from Redis")
+        parent_hashes = self.redis.get_keys(Keys.get_hash_parent('*'))
+        for redis_hash in parent_hashes:
+            self._pre_hydrated_hashes[redis_hash] = self.redis.hgetall(
+                redis_hash)
+        self.logger.info("Loaded %s parent hashes from Redis",
+                         len(self.pre_hydrated_hashes))
+
+    def _get_stored_values(self, redis_hash: str,
+                           keys: List[str]) -> Dict[str, Optional[bytes]]:
+        # Get the values stored for the keys either from the pre-hydrated
+        # parent hash or from Redis in a single round trip. Values taken from
+        # the pre-hydrated hash are removed from it, as from then on the state
+        # in memory is more recent.
+        if redis_hash in self.pre_hydrated_hashes:
+            pre_hydrated_hash = self._pre_hydrated_hashes[redis_hash]
+            return {key: pre_hydrated_hash.pop(key) for key in keys
+                    if key in pre_hydrated_hash}
+
+        return self.redis.hmget(redis_hash, keys)
+
     def load_state(self, system: Union[System, GitHubRepo]) \
             -> Union[System, GitHubRepo]:
         # If Redis is down, the data passed as default will be stored as
@@ -81,155 +117,57 @@ class SystemDataTransformer(DataTransformer):
 
         # Below, we will try and get the data stored in redis and store it
         # in the system's state. If the data from Redis cannot be obtained, the
-        # state won't be updated.
-
-        # Load process_cpu_seconds_total from Redis
-        state_process_cpu_seconds_total = system.process_cpu_seconds_total
-        redis_process_cpu_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_process_cpu_seconds_total(system_id),
-            state_process_cpu_seconds_total)
-        process_cpu_seconds_total = \
-            convert_to_float_if_not_none(redis_process_cpu_seconds_total, None)
-        system.set_process_cpu_seconds_total(process_cpu_seconds_total)
-
-        # Load process_memory_usage from Redis
-        state_process_memory_usage = system.process_memory_usage
-        redis_process_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_process_memory_usage(system_id),
-            state_process_memory_usage)
-        process_memory_usage = \
-            convert_to_float_if_not_none(redis_process_memory_usage, None)
-        system.set_process_memory_usage(process_memory_usage)
-
-        # Load virtual_memory_usage from Redis
-        state_virtual_memory_usage = system.virtual_memory_usage
-        redis_virtual_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_virtual_memory_usage(system_id),
-            state_virtual_memory_usage)
-        virtual_memory_usage = \
-            convert_to_float_if_not_none(redis_virtual_memory_usage, None)
-        system.set_virtual_memory_usage(virtual_memory_usage)
-
-        # Load open_file_descriptors from Redis
-        state_open_file_descriptors = system.open_file_descriptors
-        redis_open_file_descriptors = self.redis.hget(
-            redis_hash, Keys.get_system_open_file_descriptors(system_id),
-            state_open_file_descriptors)
-        open_file_descriptors = \
-            convert_to_float_if_not_none(redis_open_file_descriptors, None)
-        system.set_open_file_descriptors(open_file_descriptors)
-
-        # Load system_cpu_usage from Redis
-        state_system_cpu_usage = system.system_cpu_usage
-        redis_system_cpu_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_cpu_usage(system_id),
-            state_system_cpu_usage)
-        system_cpu_usage = \
-            convert_to_float_if_not_none(redis_system_cpu_usage, None)
-        system.set_system_cpu_usage(system_cpu_usage)
-
-        # Load system_ram_usage from Redis
-        state_system_ram_usage = system.system_ram_usage
-        redis_system_ram_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_ram_usage(system_id),
-            state_system_ram_usage)
-        system_ram_usage = \
-            convert_to_float_if_not_none(redis_system_ram_usage, None)
-        system.set_system_ram_usage(system_ram_usage)
-
-        # Load system_storage_usage from Redis
-        state_system_storage_usage = system.system_storage_usage
-        redis_system_storage_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_storage_usage(system_id),
-            state_system_storage_usage)
-        system_storage_usage = \
-            convert_to_float_if_not_none(redis_system_storage_usage, None)
-        system.set_system_storage_usage(system_storage_usage)
-
-        # Load network_transmit_bytes_per_second from Redis
-        state_network_transmit_bytes_per_second = \
-            system.network_transmit_bytes_per_second
-        redis_network_transmit_bytes_per_second = self.redis.hget(
-            redis_hash,
-            Keys.get_system_network_transmit_bytes_per_second(system_id),
-            state_network_transmit_bytes_per_second)
-        network_transmit_bytes_per_second = \
-            convert_to_float_if_not_none(
-                redis_network_transmit_bytes_per_second, None)
-        system.set_network_transmit_bytes_per_second(
-            network_transmit_bytes_per_second)
-
-        # Load network_receive_bytes_per_second from Redis
-        state_network_receive_bytes_per_second = \
-            system.network_receive_bytes_per_second
-        redis_network_receive_bytes_per_second = self.redis.hget(
-            redis_hash,
-            Keys.get_system_network_receive_bytes_per_second(system_id),
-            state_network_receive_bytes_per_second)
-        network_receive_bytes_per_second = \
-            convert_to_float_if_not_none(
-                redis_network_receive_bytes_per_second, None)
-        system.set_network_receive_bytes_per_second(
-            network_receive_bytes_per_second)
-
-        # Load network_transmit_bytes_total from Redis
-        state_network_transmit_bytes_total = system.network_transmit_bytes_total
-        redis_network_transmit_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_transmit_bytes_total(system_id),
-            state_network_transmit_bytes_total)
-        network_transmit_bytes_total = \
-            convert_to_float_if_not_none(redis_network_transmit_bytes_total,
-                                         None)
-        system.set_network_transmit_bytes_total(network_transmit_bytes_total)
-
-        # Load network_receive_bytes_total from Redis
-        state_network_receive_bytes_total = system.network_receive_bytes_total
-        redis_network_receive_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_receive_bytes_total(system_id),
-            state_network_receive_bytes_total)
-        network_receive_bytes_total = \
-            convert_to_float_if_not_none(redis_network_receive_bytes_total,
-                                         None)
-        system.set_network_receive_bytes_total(network_receive_bytes_total)
-
-        # Load disk_io_time_seconds_in_interval from Redis
-        state_disk_io_time_seconds_in_interval = \
-            system.disk_io_time_seconds_in_interval
-        redis_disk_io_time_seconds_in_interval = self.redis.hget(
-            redis_hash,
-            Keys.get_system_disk_io_time_seconds_in_interval(system_id),
-            state_disk_io_time_seconds_in_interval)
-        disk_io_time_seconds_in_interval = \
-            convert_to_float_if_not_none(
-                redis_disk_io_time_seconds_in_interval, None)
-        system.set_disk_io_time_seconds_in_interval(
-            disk_io_time_seconds_in_interval)
-
-        # Load disk_io_time_seconds_total from Redis
-        state_disk_io_time_seconds_total = system.disk_io_time_seconds_total
-        redis_disk_io_time_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_disk_io_time_seconds_total(system_id),
-            state_disk_io_time_seconds_total)
-        disk_io_time_seconds_total = \
-            convert_to_float_if_not_none(redis_disk_io_time_seconds_total, None)
-        system.set_disk_io_time_seconds_total(disk_io_time_seconds_total)
-
-        # Load last_monitored from Redis
-        state_last_monitored = system.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_system_last_monitored(system_id),
-            state_last_monitored)
-        last_monitored = convert_to_float_if_not_none(redis_last_monitored,
-                                                      None)
-        system.set_last_monitored(last_monitored)
-
-        # Load went_down_at from Redis
-        state_went_down_at = system.went_down_at
-        redis_went_down_at = self.redis.hget(
-            redis_hash, Keys.get_system_went_down_at(system_id),
-            state_went_down_at)
-        went_down_at = convert_to_float_if_not_none(redis_went_down_at, None)
-        system.set_went_down_at(went_down_at)
+        # state won't be updated. Every field is stored under a key of the
+        # parent hash, together with the setter of the field and its current
+        # value which is kept if the key is not stored in Redis.
+        state_fields = [
+            (Keys.get_system_process_cpu_seconds_total(system_id),
+             system.process_cpu_seconds_total,
+             system.set_process_cpu_seconds_total),
+            (Keys.get_system_process_memory_usage(system_id),
+             system.process_memory_usage, system.set_process_memory_usage),
+            (Keys.get_system_virtual_memory_usage(system_id),
+             system.virtual_memory_usage, system.set_virtual_memory_usage),
+            (Keys.get_system_open_file_descriptors(system_id),
+             system.open_file_descriptors, system.set_open_file_descriptors),
+            (Keys.get_system_system_cpu_usage(system_id),
+             system.system_cpu_usage, system.set_system_cpu_usage),
+            (Keys.get_system_system_ram_usage(system_id),
+             system.system_ram_usage, system.set_system_ram_usage),
+            (Keys.get_system_system_storage_usage(system_id),
+             system.system_storage_usage, system.set_system_storage_usage),
+            (Keys.get_system_network_transmit_bytes_per_second(system_id),
+             system.network_transmit_bytes_per_second,
+             system.set_network_transmit_bytes_per_second),
+            (Keys.get_system_network_receive_bytes_per_second(system_id),
+             system.network_receive_bytes_per_second,
+             system.set_network_receive_bytes_per_second),
+            (Keys.get_system_network_transmit_bytes_total(system_id),
+             system.network_transmit_bytes_total,
+             system.set_network_transmit_bytes_total),
+            (Keys.get_system_network_receive_bytes_total(system_id),
+             system.network_receive_bytes_total,
+             system.set_network_receive_bytes_total),
+            (Keys.get_system_disk_io_time_seconds_in_interval(system_id),
+             system.disk_io_time_seconds_in_interval,
+             system.set_disk_io_time_seconds_in_interval),
+            (Keys.get_system_disk_io_time_seconds_total(system_id),
+             system.disk_io_time_seconds_total,
+             system.set_disk_io_time_seconds_total),
+            (Keys.get_system_last_monitored(system_id),
+             system.last_monitored, system.set_last_monitored),
+            (Keys.get_system_went_down_at(system_id),
+             system.went_down_at, system.set_went_down_at),
+        ]
+        stored_values = self._get_stored_values(
+            redis_hash, [key for key, _, _ in state_fields])
+
+        loaded_values = []
+        for key, state_value, set_value in state_fields:
+            value = convert_to_float_if_not_none(
+                stored_values.get(key, state_value), None)
+            set_value(value)
+            loaded_values.append(value)
 
         self.logger.debug(
             "Restored %s state: _process_cpu_seconds_total=%s, "
@@ -242,13 +180,7 @@ class SystemDataTransformer(DataTransformer):
             "_network_receive_bytes_total=%s, "
             "_disk_io_time_seconds_in_interval=%s, "
             "_disk_io_time_seconds_total=%s, _last_monitored=%s, "
-            "_went_down_at=%s", system, process_cpu_seconds_total,
-            process_memory_usage, virtual_memory_usage, open_file_descriptors,
-            system_cpu_usage, system_ram_usage, system_storage_usage,
-            network_transmit_bytes_per_second, network_receive_bytes_per_second,
-            network_transmit_bytes_total, network_receive_bytes_total,
-            disk_io_time_seconds_in_interval, disk_io_time_seconds_total,
-            last_monitored, went_down_at)
+            "_went_down_at=%s", system, *loaded_values)
 
         return system
 
@@ -316,8 +248,10 @@ class SystemDataTransformer(DataTransformer):
                                              transformed_data: Dict) -> Dict:
         self.logger.debug("Performing further processing for storage ...")
 
+        # The transformed data is not modified once built, therefore it is
+        # shared rather than copied.
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
@@ -338,7 +272,7 @@ class SystemDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -386,10 +320,13 @@ class SystemDataTransformer(DataTransformer):
             system = self.state[td_system_id]
             downtime_exception = SystemIsDownException(td_system_name)
 
-            processed_data = copy.deepcopy(transformed_data)
-
             if td_error_code == downtime_exception.code:
+                # Only the data is reformatted, the rest is shared with the
+                # transformed data
                 td_metrics = transformed_data['error']['data']
+                processed_data = {
+                    'error': {**transformed_data['error'], 'data': {}}
+                }
                 processed_data_metrics = processed_data['error']['data']
 
                 for metric, value in td_metrics.items():
@@ -398,6 +335,8 @@ class SystemDataTransformer(DataTransformer):
 
                 processed_data_metrics['went_down_at']['previous'] = \
                     system.went_down_at
+            else:
+                processed_data = transformed_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_alerting".format(self))
@@ -448,7 +387,15 @@ class SystemDataTransformer(DataTransformer):
                     disk_io_time_seconds_total - \
                     system.disk_io_time_seconds_total
 
-            transformed_data = copy.deepcopy(data)
+            # Only the dicts which are modified are copied. Their values are
+            # shared with the received data.
+            transformed_data = {
+                'result': {
+                    **data['result'],
+                    'meta_data': dict(meta_data),
+                    'data': dict(system_metrics),
+                }
+            }
             td_meta_data = transformed_data['result']['meta_data']
             td_metrics = transformed_data['result']['data']
 
@@ -477,7 +424,9 @@ class SystemDataTransformer(DataTransformer):
 
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
+            transformed_data = {
+                'error': {**data['error'], 'meta_data': dict(meta_data)}
+            }
             del transformed_data['error']['meta_data']['monitor_name']
 
             # If we have a downtime error, set went_down_at to the time of error
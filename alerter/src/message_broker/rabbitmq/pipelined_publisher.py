@@ -0,0 +1,174 @@
+import logging
+from queue import Queue
+from typing import Dict, List
+
+from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils.exceptions import MessageWasNotDeliveredException
+
+
+class PipelinedPublisher:
+    """
+    Publishes the data in a publishing queue while keeping up to window_size
+    messages waiting for their publisher confirm, instead of waiting for the
+    confirm of each message before publishing the next one. Data is removed
+    from the publishing queue only once it was acked, and in queue order.
+    Nacked data is re-sent. Queued data is a dict with the exchange,
+    routing_key, data, properties and mandatory keys, where data is the
+    serialised message.
+    """
+
+    def __init__(self, logger: logging.Logger, rabbitmq: RabbitMQApi,
+                 window_size: int, confirm_timeout: float = 10) -> None:
+        """
+        :param logger: The logger object to log with
+        :param rabbitmq: The rabbit MQ connection to use
+        :param window_size: The maximum number of unconfirmed messages
+        :param confirm_timeout: How many seconds to wait for a confirm before
+        checking the connection again
+        """
+        self._logger = logger
+        self._rabbitmq = rabbitmq
+        self._window_size = window_size
+        self._confirm_timeout = confirm_timeout
+
+        # The queued data waiting for a confirm by delivery tag. The data is
+        # identified by id, therefore the data which is sent or acked is also
+        # kept by id so that the ids stay unique while used.
+        self._unconfirmed: Dict[int, Dict] = {}
+        self._sent: Dict[int, Dict] = {}
+        self._acked: Dict[int, Dict] = {}
+        self._returned: List[Dict] = []
+
+    @property
+    def window_size(self) -> int:
+        return self._window_size
+
+    @property
+    def unconfirmed(self) -> Dict[int, Dict]:
+        return self._unconfirmed
+
+    def _reset(self) -> None:
+        # The confirms of the data in flight will never arrive, therefore it
+        # must be sent again. Data which was acked is still removed.
+        self._unconfirmed.clear()
+        self._sent.clear()
+        self._returned.clear()
+
+    def _on_confirm(self, delivery_tag: int, multiple: bool,
+                    acked: bool) -> None:
+        if multiple:
+            tags = [tag for tag in self._unconfirmed if tag <= delivery_tag]
+        else:
+            tags = [delivery_tag]
+
+        for tag in tags:
+            data = self._unconfirmed.pop(tag, None)
+            if data is None:
+                continue
+            self._sent.pop(id(data), None)
+            if not acked:
+                self._logger.warning("%s was nacked by RabbitMQ, it will be "
+                                     "sent again", data)
+            elif any(data is returned for returned in self._returned):
+                self._logger.debug("%s could not be routed", data)
+            else:
+                self._logger.debug("Sent %s to '%s' exchange", data['data'],
+                                   data['exchange'])
+                self._acked[id(data)] = data
+
+    def _on_return(self, exchange: str, routing_key: str, body: bytes) -> None:
+        # A mandatory message which is not routed is returned just before it is
+        # acked. The returned message is matched with the oldest unconfirmed
+        # data having the same exchange, routing key and body.
+        for tag in sorted(self._unconfirmed):
+            data = self._unconfirmed[tag]
+            data_body = data['data']
+            if isinstance(data_body, str):
+                data_body = data_body.encode()
+            if data['exchange'] == exchange \
+                    and data['routing_key'] == routing_key \
+                    and data_body == body:
+                self._returned.append(data)
+                return
+
+    def _remove_acked(self, publishing_queue: Queue) -> None:
+        # Remove the data at the start of the queue which was acked. Data
+        # behind unacked data is removed once the data before it is acked.
+        while not publishing_queue.empty() \
+                and id(publishing_queue.queue[0]) in self._acked:
+            data = publishing_queue.get()
+            publishing_queue.task_done()
+            del self._acked[id(data)]
+
+        # Forget any data which was removed from the queue because the queue
+        # was full
+        queued_ids = {id(data) for data in publishing_queue.queue}
+        for data_id in [data_id for data_id in self._acked
+                        if data_id not in queued_ids]:
+            del self._acked[data_id]
+
+    def _publish_unsent(self, publishing_queue: Queue) -> bool:
+        # Publish the queued data which was not sent yet, as long as there is
+        # space in the window. Returns False if RabbitMQ is unusable.
+        for data in list(publishing_queue.queue):
+            if len(self._unconfirmed) >= self._window_size:
+                break
+            if id(data) in self._sent or id(data) in self._acked:
+                continue
+
+            try:
+                delivery_tag = self._rabbitmq.basic_publish_pipelined(
+                    exchange=data['exchange'], routing_key=data['routing_key'],
+                    body=data['data'], properties=data['properties'],
+                    mandatory=data['mandatory'])
+            except KeyError as ke:
+                self._logger.error("Enqueued datum %s was incomplete", data)
+                self._logger.exception(ke)
+                self._logger.warning("Discarding this datum")
+                self._acked[id(data)] = data
+                continue
+
+            if delivery_tag == -1:
+                return False
+            self._unconfirmed[delivery_tag] = data
+            self._sent[id(data)] = data
+
+        return True
+
+    def send_data(self, publishing_queue: Queue) -> None:
+        """
+        Sends all the data in the publishing queue, and returns once all of it
+        was acked. If a mandatory message could not be routed, the data after
+        it is not sent and MessageWasNotDeliveredException is raised once the
+        data in flight is confirmed. The data which is not acked is left in the
+        queue, to be sent again by the next call.
+        :param publishing_queue: The queue of the data to send
+        """
+        if not self._rabbitmq.is_pipelined_channel_open:
+            self._reset()
+            if self._rabbitmq.open_pipelined_channel(
+                    self._on_confirm, self._on_return) == -1:
+                return
+
+        try:
+            while True:
+                if not self._returned \
+                        and not self._publish_unsent(publishing_queue):
+                    break
+                if not self._unconfirmed:
+                    break
+                if self._rabbitmq.process_data_events(
+                        self._confirm_timeout) == -1:
+                    break
+                self._remove_acked(publishing_queue)
+        except Exception:
+            self._reset()
+            raise
+        finally:
+            self._remove_acked(publishing_queue)
+
+        if self._returned:
+            returned = self._returned[0]
+            self._returned.clear()
+            raise MessageWasNotDeliveredException(
+                "{} could not be routed".format(returned))
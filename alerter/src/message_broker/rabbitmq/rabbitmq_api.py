@@ -41,6 +41,10 @@ class RabbitMQApi:
         # A boolean variable which keeps track of the connection status with
         # RabbitMQ
         self._is_connected = False
+        # The channel used for pipelined publishing, together with the delivery
+        # tag of the last message published on it
+        self._pipelined_channel = None
+        self._pipelined_delivery_tag = 0
 
     @property
     def is_connected(self) -> bool:
@@ -58,6 +62,15 @@ class RabbitMQApi:
     def channel(self) -> Optional[BlockingChannel]:
         return self._channel
 
+    @property
+    def pipelined_channel(self) -> Optional[BlockingChannel]:
+        return self._pipelined_channel
+
+    @property
+    def is_pipelined_channel_open(self) -> bool:
+        return self.pipelined_channel is not None and \
+               self.pipelined_channel.is_open
+
     @property
     def port(self) -> int:
         return self._port
@@ -296,6 +309,80 @@ class RabbitMQApi:
             # If a message is not delivered, the exception below is raised.
             raise MessageWasNotDeliveredException(e)
 
+    # Should not be used if connection has not yet been initialised
+    def open_pipelined_channel_unsafe(
+            self, on_confirm: Callable[[int, bool, bool], None],
+            on_return: Callable[[str, str, bytes], None]) -> None:
+        # A channel in confirm mode normally blocks on every publish until the
+        # message is confirmed. Pipelined publishing uses a separate channel
+        # whose confirms and returns are instead passed to the callbacks as
+        # they arrive. The blocking adapter offers no way to do this, so the
+        # callbacks are registered on the channel it wraps. on_confirm is
+        # called with the delivery tag, whether the confirm covers all the
+        # tags up to the delivery tag, and whether the message was acked.
+        # on_return is called with the exchange, routing key and body of a
+        # mandatory message which could not be routed.
+        def on_ack_nack(frame: pika.frame.Method) -> None:
+            on_confirm(frame.method.delivery_tag, frame.method.multiple,
+                       isinstance(frame.method, pika.spec.Basic.Ack))
+            # Make process_data_events return now that a confirm arrived
+            self.connection.add_callback_threadsafe(lambda: None)
+
+        def on_basic_return(channel, method: pika.spec.Basic.Return,
+                            properties: pika.spec.BasicProperties,
+                            body: bytes) -> None:
+            on_return(method.exchange, method.routing_key, body)
+
+        if self.is_pipelined_channel_open:
+            self._logger.info("Closing pipelined RabbitMQ Channel")
+            self.pipelined_channel.close()
+        channel = self.connection.channel()
+        channel._impl.add_on_return_callback(on_basic_return)
+        channel._impl.confirm_delivery(ack_nack_callback=on_ack_nack)
+        self._pipelined_channel = channel
+        self._pipelined_delivery_tag = 0
+        self._logger.info("Created a pipelined RabbitMQ Channel")
+
+    def open_pipelined_channel(
+            self, on_confirm: Callable[[int, bool, bool], None],
+            on_return: Callable[[str, str, bytes], None]) -> Optional[int]:
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        args = [on_confirm, on_return]
+        if self._connection_initialised():
+            return self._safe(self.open_pipelined_channel_unsafe, args, -1)
+
+    # Should not be used if the pipelined channel has not yet been opened
+    def basic_publish_pipelined_unsafe(
+            self, exchange: str, routing_key: str, body: Union[str, bytes],
+            properties: pika.spec.BasicProperties = None,
+            mandatory: bool = False) -> int:
+        self.pipelined_channel._impl.basic_publish(
+            exchange, routing_key, body, properties, mandatory)
+        self._pipelined_delivery_tag += 1
+        return self._pipelined_delivery_tag
+
+    def basic_publish_pipelined(self, exchange: str, routing_key: str,
+                                body: Union[str, bytes],
+                                properties: pika.spec.BasicProperties = None,
+                                mandatory: bool = False) -> Optional[int]:
+        # Publish a message on the pipelined channel without waiting for it to
+        # be confirmed. The delivery tag of the message is returned, which is
+        # used to match the message with its confirm.
+        args = [exchange, routing_key, body, properties, mandatory]
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self.basic_publish_pipelined_unsafe, args, -1)
+
+    def process_data_events(self, time_limit: Optional[float] = 0) \
+            -> Optional[int]:
+        args = [time_limit]
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self.connection.process_data_events, args, -1)
+
     def basic_consume(self, queue: str, on_message_callback: Callable,
                       auto_ack: bool = False, exclusive: bool = False,
                       consumer_tag: str = None) -> Optional[int]:
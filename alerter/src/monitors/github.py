@@ -1,9 +1,8 @@
-import copy
 import json
 import logging
 from datetime import datetime
 from http.client import IncompleteRead
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 import pika
 import pika.exceptions
@@ -15,7 +14,7 @@ from src.configs.repo import RepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.monitor import Monitor
 from src.utils.constants import RAW_DATA_EXCHANGE
-from src.utils.data import get_json
+from src.utils.data import get_json_if_modified
 from src.utils.exceptions import (DataReadingException, PANICException,
                                   CannotAccessGitHubPageException,
                                   GitHubAPICallException, JSONDecodeException)
@@ -28,17 +27,29 @@ class GitHubMonitor(Monitor):
         super().__init__(monitor_name, logger, monitor_period, rabbitmq)
         self._repo_config = repo_config
 
+        # The ETag of the last releases page received, sent with the next
+        # request so that GitHub replies with a 304 if nothing changed.
+        self._etag = None
+
     @property
     def repo_config(self) -> RepoConfig:
         return self._repo_config
 
+    @property
+    def etag(self) -> Optional[str]:
+        return self._etag
+
     def _display_data(self, data: Dict) -> str:
         # To cater for releases with unicode characters we must first encode
         # as utf-8 and then decode
         return json.dumps(data, ensure_ascii=False).encode('utf8').decode()
 
-    def _get_data(self) -> Dict:
-        return get_json(self.repo_config.releases_page, self.logger)
+    def _get_data(self) -> Optional[List]:
+        # Returns None if the releases did not change since the last request.
+        # Note that unchanged requests do not count against the rate limit.
+        data, self._etag = get_json_if_modified(
+            self.repo_config.releases_page, self.logger, self.etag)
+        return data
 
     def _process_error(self, error: PANICException) -> Dict:
         processed_data = {
@@ -57,8 +68,21 @@ class GitHubMonitor(Monitor):
 
         return processed_data
 
-    def _process_retrieved_data(self, data: Dict) -> Dict:
-        data_copy = copy.deepcopy(data)
+    def _process_retrieved_data(self, data: Optional[List]) -> Dict:
+        if data is None:
+            # Only inform the data transformer that the releases are unchanged
+            return {
+                'result': {
+                    'meta_data': {
+                        'monitor_name': self.monitor_name,
+                        'repo_name': self.repo_config.repo_name,
+                        'repo_id': self.repo_config.repo_id,
+                        'repo_parent_id': self.repo_config.parent_id,
+                        'time': datetime.now().timestamp()
+                    },
+                    'unchanged': True,
+                }
+            }
 
         # Add some meta-data to the processed data
         processed_data = {
@@ -74,8 +98,8 @@ class GitHubMonitor(Monitor):
             }
         }
 
-        for i in range(len(data_copy)):
-            release_data = data_copy[i]
+        for i in range(len(data)):
+            release_data = data[i]
             processed_data['result']['data'][str(i)] = {}
             processed_data['result']['data'][str(i)]['release_name'] = \
                 release_data['name']
@@ -95,7 +119,12 @@ class GitHubMonitor(Monitor):
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange.", RAW_DATA_EXCHANGE)
 
-    def _monitor(self) -> None:
+    def _retrieve_data(self) -> Tuple[Optional[List], bool,
+                                      Optional[PANICException]]:
+        # Retrieves the data and converts any retrieval errors into the
+        # respective PANIC exception. This was separated from the rest of the
+        # monitoring round so that the data of many repos can be retrieved
+        # together (see GitHubGraphQLMonitor).
         data_retrieval_exception = None
         data = None
         data_retrieval_failed = False
@@ -104,7 +133,7 @@ class GitHubMonitor(Monitor):
 
             # If response contains a message this indicates an error in the
             # GitHub API Call
-            if 'message' in data:
+            if data is not None and 'message' in data:
                 data_retrieval_failed = True
                 data_retrieval_exception = GitHubAPICallException(
                     data['message'])
@@ -133,6 +162,11 @@ class GitHubMonitor(Monitor):
                               self.repo_config.releases_page)
             self.logger.exception(data_retrieval_exception)
 
+        return data, data_retrieval_failed, data_retrieval_exception
+
+    def _process_and_send_data(
+            self, data: Optional[List], data_retrieval_failed: bool,
+            data_retrieval_exception: Optional[PANICException]) -> None:
         try:
             processed_data = self._process_data(data, data_retrieval_failed,
                                                 data_retrieval_exception)
@@ -147,8 +181,12 @@ class GitHubMonitor(Monitor):
 
         if not data_retrieval_failed:
             # Only output the gathered metrics if there was no error
-            self.logger.info(self._display_data(
-                processed_data['result']['data']))
+            if data is None:
+                self.logger.info("The releases of %s did not change",
+                                 self.repo_config)
+            else:
+                self.logger.info(self._display_data(
+                    processed_data['result']['data']))
 
         # Send a heartbeat only if the entire round was successful
         heartbeat = {
@@ -157,3 +195,9 @@ class GitHubMonitor(Monitor):
             'timestamp': datetime.now().timestamp()
         }
         self._send_heartbeat(heartbeat)
+
+    def _monitor(self) -> None:
+        data, data_retrieval_failed, data_retrieval_exception = \
+            self._retrieve_data()
+        self._process_and_send_data(data, data_retrieval_failed,
+                                    data_retrieval_exception)
@@ -0,0 +1,290 @@
+import json
+import logging
+import multiprocessing
+import queue
+import sys
+from datetime import datetime
+from http.client import IncompleteRead
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+import pika
+import pika.exceptions
+from requests.exceptions import (ConnectionError as ReqConnectionError,
+                                 ReadTimeout, ChunkedEncodingError)
+from urllib3.exceptions import ProtocolError
+
+from src.abstract import Component
+from src.abstract.publisher import PublisherComponent
+from src.configs.repo import RepoConfig
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.github import GitHubMonitor
+from src.monitors.multiplexer import (ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.utils.constants import (RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
+                                 GITHUB_MONITOR_NAME_TEMPLATE,
+                                 GITHUB_GRAPHQL_API_URL,
+                                 GITHUB_RELEASES_PAGE_SIZE)
+from src.utils.exceptions import (PANICException,
+                                  MessageWasNotDeliveredException,
+                                  CannotAccessGitHubPageException,
+                                  DataReadingException, GitHubAPICallException,
+                                  JSONDecodeException)
+from src.utils.http import get_shared_http_client
+from src.utils.logging import log_and_print
+
+_REPO_QUERY_TEMPLATE = '''
+  {alias}: repository(owner: {owner}, name: {name}) {{
+    releases(first: {page_size},
+             orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      nodes {{ name tagName }}
+    }}
+  }}'''
+
+
+class GitHubGraphQLMonitor(PublisherComponent):
+    """
+    Monitors the releases of many repos from a single process using the
+    GitHub GraphQL API. The releases of up to `batch_size` repos are requested
+    in one query. The result of each repo is then processed and published by
+    the GitHub monitor of that repo, so the data transformer receives the same
+    messages as when every repo is monitored by its own process.
+    """
+
+    def __init__(self, name: str, logger: logging.Logger, monitor_period: int,
+                 rabbitmq: RabbitMQApi, commands: multiprocessing.Queue,
+                 api_token: str, batch_size: int = 50) -> None:
+        """
+        :param name: The name of the monitor
+        :param logger: The logger object to log with
+        :param monitor_period: The time to wait between monitoring rounds
+        :param rabbitmq: The rabbit MQ connection shared by all repos
+        :param commands: The queue from which add/remove commands are read
+        :param api_token: The GitHub token used to access the GraphQL API
+        :param batch_size: The maximum number of repos per query
+        """
+        self._name = name
+        self._monitor_period = monitor_period
+        self._commands = commands
+        self._api_token = api_token
+        self._batch_size = batch_size
+        self._monitors = {}
+
+        super().__init__(logger, rabbitmq)
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def monitor_period(self) -> int:
+        return self._monitor_period
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def monitors(self) -> Dict[str, GitHubMonitor]:
+        return self._monitors
+
+    def _initialise_rabbitmq(self) -> None:
+        self.rabbitmq.connect_till_successful()
+        self.logger.info("Setting delivery confirmation on RabbitMQ channel")
+        self.rabbitmq.confirm_delivery()
+        self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
+        self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, 'direct', False,
+                                       True, False, False)
+        self.logger.info("Creating '%s' exchange", HEALTH_CHECK_EXCHANGE)
+        self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
+                                       True, False, False)
+
+    def _add_monitor(self, config_id: str, repo_config: RepoConfig) -> None:
+        monitor_name = GITHUB_MONITOR_NAME_TEMPLATE.format(
+            repo_config.repo_name.replace('/', ' ')[:-1])
+        monitor = GitHubMonitor(monitor_name, repo_config,
+                                self.logger.getChild(monitor_name),
+                                self.monitor_period, self.rabbitmq)
+
+        # Creating a monitor registers its own termination handlers, therefore
+        # point them back to this monitor.
+        Component.__init__(self)
+
+        if config_id in self.monitors:
+            log_and_print("Replacing the monitor of {} with the latest "
+                          "configuration".format(config_id), self.logger)
+        else:
+            log_and_print("Added {} to {}".format(monitor_name, self),
+                          self.logger)
+        self._monitors[config_id] = monitor
+
+    def _remove_monitor(self, config_id: str) -> None:
+        if config_id in self.monitors:
+            monitor = self._monitors.pop(config_id)
+            log_and_print("Removed {} from {}".format(monitor, self),
+                          self.logger)
+
+    def _process_commands(self) -> None:
+        # Apply all the commands sent by the manager since the last round
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                break
+
+            self.logger.debug("Received command %s", command)
+            if command['action'] == ADD_MONITOR_COMMAND:
+                self._add_monitor(command['config_id'],
+                                  command['repo_config'])
+            elif command['action'] == REMOVE_MONITOR_COMMAND:
+                self._remove_monitor(command['config_id'])
+            else:
+                self.logger.error("Received unknown command %s", command)
+
+    @staticmethod
+    def _build_query(monitors: List[GitHubMonitor]) -> str:
+        # Every repo is queried under the alias r<index>. The owner and name
+        # are JSON encoded, which also produces valid GraphQL strings.
+        repo_queries = []
+        for index, monitor in enumerate(monitors):
+            owner, name = monitor.repo_config.repo_name.strip('/').split('/')
+            repo_queries.append(_REPO_QUERY_TEMPLATE.format(
+                alias='r{}'.format(index), owner=json.dumps(owner),
+                name=json.dumps(name), page_size=GITHUB_RELEASES_PAGE_SIZE))
+        return 'query {' + ''.join(repo_queries) + '\n}'
+
+    def _get_data(self, monitors: List[GitHubMonitor]) -> Dict:
+        headers = {'Authorization': 'bearer {}'.format(self._api_token)}
+        with get_shared_http_client().post(
+                GITHUB_GRAPHQL_API_URL, self.logger, timeout=15,
+                json={'query': self._build_query(monitors)},
+                headers=headers) as response:
+            content = response.content
+        return json.loads(content.decode('UTF-8'))
+
+    @staticmethod
+    def _get_repo_error_message(response: Dict, alias: str) -> str:
+        for error in response.get('errors') or []:
+            if error.get('path', [None])[0] == alias:
+                return error.get('message', '')
+
+        # If the whole query failed, report the first error
+        if response.get('errors'):
+            return response['errors'][0].get('message', '')
+        return response.get('message', 'No data returned for the repo')
+
+    def _retrieve_batch(self, monitors: List[GitHubMonitor]) \
+            -> List[Tuple[Optional[List], bool, Optional[PANICException]]]:
+        # Returns the data of each repo in the same format as returned by
+        # GitHubMonitor._retrieve_data, so that it can be processed by the
+        # monitor of each repo.
+        batch_exception = None
+        response = {}
+        try:
+            response = self._get_data(monitors)
+        except (ReqConnectionError, ReadTimeout):
+            batch_exception = CannotAccessGitHubPageException(
+                GITHUB_GRAPHQL_API_URL)
+        except (IncompleteRead, ChunkedEncodingError, ProtocolError):
+            batch_exception = DataReadingException(self.name,
+                                                   GITHUB_GRAPHQL_API_URL)
+        except json.JSONDecodeError as e:
+            batch_exception = JSONDecodeException(e)
+
+        if batch_exception is not None:
+            self.logger.error("Error when retrieving data from %s",
+                              GITHUB_GRAPHQL_API_URL)
+            self.logger.exception(batch_exception)
+            return [(None, True, batch_exception)] * len(monitors)
+
+        retrieved_data = []
+        data = response.get('data') or {}
+        for index, monitor in enumerate(monitors):
+            alias = 'r{}'.format(index)
+            repo_data = data.get(alias)
+            if repo_data is None:
+                exception = GitHubAPICallException(
+                    self._get_repo_error_message(response, alias))
+                monitor.logger.error("Error when retrieving data from %s: "
+                                     "(%s, %s)", GITHUB_GRAPHQL_API_URL,
+                                     exception.message, exception.code)
+                retrieved_data.append((None, True, exception))
+            else:
+                releases = [
+                    {'name': node['name'], 'tag_name': node['tagName']}
+                    for node in repo_data['releases']['nodes']
+                ]
+                retrieved_data.append((releases, False, None))
+
+        return retrieved_data
+
+    def _send_data(self) -> None:
+        # Each monitor publishes its own data
+        pass
+
+    def _send_heartbeat(self, data_to_send: dict) -> None:
+        self.rabbitmq.basic_publish_confirm(
+            exchange=HEALTH_CHECK_EXCHANGE, routing_key='heartbeat.worker',
+            body=data_to_send, is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+        self.logger.debug("Sent heartbeat to '%s' exchange",
+                          HEALTH_CHECK_EXCHANGE)
+
+    def _monitor(self) -> None:
+        self._process_commands()
+
+        monitors = list(self.monitors.values())
+        for start in range(0, len(monitors), self.batch_size):
+            batch = monitors[start:start + self.batch_size]
+            retrieved_data = self._retrieve_batch(batch)
+            for monitor, (data, data_retrieval_failed,
+                          data_retrieval_exception) in zip(batch,
+                                                           retrieved_data):
+                try:
+                    monitor._process_and_send_data(data,
+                                                   data_retrieval_failed,
+                                                   data_retrieval_exception)
+                except MessageWasNotDeliveredException as e:
+                    # Do not let the other repos miss their round because the
+                    # message of one repo could not be delivered.
+                    monitor.logger.exception(e)
+
+        heartbeat = {
+            'component_name': self.name,
+            'is_alive': True,
+            'timestamp': datetime.now().timestamp()
+        }
+        self._send_heartbeat(heartbeat)
+
+    def start(self) -> None:
+        self._initialise_rabbitmq()
+        while True:
+            try:
+                self._monitor()
+            except MessageWasNotDeliveredException as e:
+                self.logger.exception(e)
+            except (pika.exceptions.AMQPConnectionError,
+                    pika.exceptions.AMQPChannelError) as e:
+                # If we have either a channel error or connection error, the
+                # channel is reset, therefore we need to re-initialise the
+                # connection or channel settings
+                raise e
+            except Exception as e:
+                self.logger.exception(e)
+                raise e
+
+            self.logger.debug("Sleeping for %s seconds.", self.monitor_period)
+
+            # Use the BlockingConnection sleep to avoid dropped connections
+            self.rabbitmq.connection.sleep(self.monitor_period)
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        log_and_print("{} is terminating. Connections with RabbitMQ will be "
+                      "closed, and afterwards the process will exit."
+                      .format(self), self.logger)
+        self.disconnect_from_rabbit()
+        log_and_print("{} terminated.".format(self), self.logger)
+        sys.exit()
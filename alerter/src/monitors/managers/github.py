@@ -3,7 +3,7 @@ import json
 import logging
 import multiprocessing
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,13 +11,17 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.configs.repo import RepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import MonitorsManager
-from src.monitors.starters import start_github_monitor
+from src.monitors.multiplexer import (ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.monitors.starters import (start_github_monitor,
+                                   start_github_graphql_monitor)
 from src.utils import env
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
                                get_removed_configs)
 from src.utils.constants import (CONFIG_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                  GITHUB_MONITORS_MANAGER_CONFIGS_QUEUE_NAME,
-                                 GITHUB_MONITOR_NAME_TEMPLATE)
+                                 GITHUB_MONITOR_NAME_TEMPLATE,
+                                 GITHUB_GRAPHQL_MONITOR_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
 from src.utils.types import str_to_bool
@@ -31,15 +35,30 @@ GH_MON_MAN_ROUTING_KEY_GEN = 'general.repos_config'
 class GitHubMonitorsManager(MonitorsManager):
 
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi, use_graphql: bool = False) -> None:
         super().__init__(logger, manager_name, rabbitmq)
 
         self._repos_configs = {}
 
+        # If the GraphQL API is used, all repos are monitored by a single
+        # GitHub GraphQL Monitor process which is controlled through the
+        # commands queue.
+        self._use_graphql = use_graphql
+        self._graphql_monitor_process = None
+        self._graphql_monitor_commands = None
+
     @property
     def repos_configs(self) -> Dict:
         return self._repos_configs
 
+    @property
+    def use_graphql(self) -> bool:
+        return self._use_graphql
+
+    @property
+    def graphql_monitor_process(self) -> Optional[multiprocessing.Process]:
+        return self._graphql_monitor_process
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
 
@@ -87,8 +106,61 @@ class GitHubMonitorsManager(MonitorsManager):
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
         self.rabbitmq.confirm_delivery()
 
+    def _start_graphql_monitor_process(self) -> None:
+        self._graphql_monitor_commands = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=start_github_graphql_monitor,
+            args=(self._graphql_monitor_commands,))
+        # Kill children if parent is killed
+        process.daemon = True
+        log_and_print("Creating a new process for the {}".format(
+            GITHUB_GRAPHQL_MONITOR_NAME), self.logger)
+        process.start()
+        self._graphql_monitor_process = process
+
+    def _add_monitor_to_graphql_monitor(self, repo_config: RepoConfig,
+                                        config_id: str, chain: str) -> None:
+        # Start the GraphQL monitor if it was never started or if it died. In
+        # the latter case the dead monitors are re-added one by one by the
+        # heartbeat procedure.
+        if self.graphql_monitor_process is None:
+            self._start_graphql_monitor_process()
+        elif not self.graphql_monitor_process.is_alive():
+            self.graphql_monitor_process.join()
+            self._start_graphql_monitor_process()
+
+        log_and_print("Adding the monitor of {} to the {}".format(
+            repo_config.repo_name, GITHUB_GRAPHQL_MONITOR_NAME), self.logger)
+        self._graphql_monitor_commands.put({
+            'action': ADD_MONITOR_COMMAND, 'config_id': config_id,
+            'repo_config': repo_config
+        })
+        self._config_process_dict[config_id] = {}
+        self._config_process_dict[config_id]['component_name'] = \
+            GITHUB_MONITOR_NAME_TEMPLATE.format(
+                repo_config.repo_name.replace('/', ' ')[:-1])
+        self._config_process_dict[config_id]['process'] = \
+            self.graphql_monitor_process
+        self._config_process_dict[config_id]['chain'] = chain
+
+    def _stop_monitor(self, config_id: str) -> None:
+        if self.use_graphql:
+            # The process is shared with other monitors, so only remove this
+            # monitor from the GraphQL monitor.
+            self._graphql_monitor_commands.put({
+                'action': REMOVE_MONITOR_COMMAND, 'config_id': config_id
+            })
+        else:
+            previous_process = self.config_process_dict[config_id]['process']
+            previous_process.terminate()
+            previous_process.join()
+
     def _create_and_start_monitor_process(self, repo_config: RepoConfig,
                                           config_id: str, chain: str) -> None:
+        if self.use_graphql:
+            self._add_monitor_to_graphql_monitor(repo_config, config_id, chain)
+            return
+
         process = multiprocessing.Process(target=start_github_monitor,
                                           args=(repo_config,))
         # Kill children if parent is killed
@@ -173,10 +245,7 @@ class GitHubMonitorsManager(MonitorsManager):
                 releases_page = env.GITHUB_RELEASES_TEMPLATE.format(repo_name)
                 repo_config = RepoConfig(repo_id, parent_id, repo_name,
                                          monitor_repo, releases_page)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
+                self._stop_monitor(config_id)
 
                 # If we should not monitor the repo, delete the previous
                 # process from the repo and move to the next config
@@ -198,10 +267,7 @@ class GitHubMonitorsManager(MonitorsManager):
             for config_id in removed_configs:
                 config = removed_configs[config_id]
                 repo_name = config['repo_name']
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
+                self._stop_monitor(config_id)
                 del self.config_process_dict[config_id]
                 del correct_repos_configs[config_id]
                 log_and_print("Killed the monitor of {} "
@@ -3,7 +3,7 @@ import json
 import logging
 import multiprocessing
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,12 +11,16 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.configs.system import SystemConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.managers.manager import MonitorsManager
-from src.monitors.starters import start_system_monitor
+from src.monitors.multiplexer import (ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.monitors.starters import (start_system_monitor,
+                                   start_system_monitors_multiplexer)
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
                                get_removed_configs)
 from src.utils.constants import (CONFIG_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                  SYSTEM_MONITORS_MANAGER_CONFIGS_QUEUE_NAME,
-                                 SYSTEM_MONITOR_NAME_TEMPLATE)
+                                 SYSTEM_MONITOR_NAME_TEMPLATE,
+                                 SYSTEM_MONITORS_MULTIPLEXER_NAME)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
 from src.utils.types import str_to_bool
@@ -30,15 +34,29 @@ SYS_MON_MAN_ROUTING_KEY_GEN = 'general.systems_config'
 class SystemMonitorsManager(MonitorsManager):
 
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi, multiplexed: bool = False) -> None:
         super().__init__(logger, manager_name, rabbitmq)
 
         self._systems_configs = {}
 
+        # If multiplexed, all systems are monitored by a single multiplexer
+        # process which is controlled through the commands queue.
+        self._multiplexed = multiplexed
+        self._multiplexer_process = None
+        self._multiplexer_commands = None
+
     @property
     def systems_configs(self) -> Dict:
         return self._systems_configs
 
+    @property
+    def multiplexed(self) -> bool:
+        return self._multiplexed
+
+    @property
+    def multiplexer_process(self) -> Optional[multiprocessing.Process]:
+        return self._multiplexer_process
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
 
@@ -87,8 +105,61 @@ class SystemMonitorsManager(MonitorsManager):
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
         self.rabbitmq.confirm_delivery()
 
+    def _start_multiplexer_process(self) -> None:
+        self._multiplexer_commands = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=start_system_monitors_multiplexer,
+            args=(self._multiplexer_commands,))
+        # Kill children if parent is killed
+        process.daemon = True
+        log_and_print("Creating a new process for the {}".format(
+            SYSTEM_MONITORS_MULTIPLEXER_NAME), self.logger)
+        process.start()
+        self._multiplexer_process = process
+
+    def _add_monitor_to_multiplexer(self, system_config: SystemConfig,
+                                    config_id: str, chain: str) -> None:
+        # Start the multiplexer if it was never started or if it died. In the
+        # latter case the dead monitors are re-added one by one by the
+        # heartbeat procedure.
+        if self.multiplexer_process is None:
+            self._start_multiplexer_process()
+        elif not self.multiplexer_process.is_alive():
+            self.multiplexer_process.join()
+            self._start_multiplexer_process()
+
+        log_and_print("Adding the monitor of {} to the {}".format(
+            system_config.system_name, SYSTEM_MONITORS_MULTIPLEXER_NAME),
+            self.logger)
+        self._multiplexer_commands.put({
+            'action': ADD_MONITOR_COMMAND, 'config_id': config_id,
+            'system_config': system_config
+        })
+        self._config_process_dict[config_id] = {}
+        self._config_process_dict[config_id]['component_name'] = \
+            SYSTEM_MONITOR_NAME_TEMPLATE.format(system_config.system_name)
+        self._config_process_dict[config_id]['process'] = \
+            self.multiplexer_process
+        self._config_process_dict[config_id]['chain'] = chain
+
+    def _stop_monitor(self, config_id: str) -> None:
+        if self.multiplexed:
+            # The process is shared with other monitors, so only remove this
+            # monitor from the multiplexer.
+            self._multiplexer_commands.put({
+                'action': REMOVE_MONITOR_COMMAND, 'config_id': config_id
+            })
+        else:
+            previous_process = self.config_process_dict[config_id]['process']
+            previous_process.terminate()
+            previous_process.join()
+
     def _create_and_start_monitor_process(self, system_config: SystemConfig,
                                           config_id: str, chain: str) -> None:
+        if self.multiplexed:
+            self._add_monitor_to_multiplexer(system_config, config_id, chain)
+            return
+
         process = multiprocessing.Process(target=start_system_monitor,
                                           args=(system_config,))
         # Kill children if parent is killed
@@ -164,10 +235,7 @@ class SystemMonitorsManager(MonitorsManager):
                 monitor_system = str_to_bool(config['monitor_system'])
                 system_config = SystemConfig(system_id, parent_id, system_name,
                                              monitor_system, node_exporter_url)
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
+                self._stop_monitor(config_id)
 
                 # If we should not monitor the system, delete the previous process
                 # from the system and move to the next config
@@ -189,10 +257,7 @@ class SystemMonitorsManager(MonitorsManager):
             for config_id in removed_configs:
                 config = removed_configs[config_id]
                 system_name = config['name']
-                previous_process = self.config_process_dict[config_id][
-                    'process']
-                previous_process.terminate()
-                previous_process.join()
+                self._stop_monitor(config_id)
                 del self.config_process_dict[config_id]
                 del correct_systems_configs[config_id]
                 log_and_print("Killed the monitor of {} "
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+import pika
+import pika.exceptions
+
+from src.abstract import Component
+from src.abstract.publisher import PublisherComponent
+from src.configs.system import SystemConfig
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.system import SystemMonitor
+from src.utils.constants import (RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
+                                 SYSTEM_MONITOR_NAME_TEMPLATE)
+from src.utils.exceptions import (PANICException,
+                                  MessageWasNotDeliveredException)
+from src.utils.logging import log_and_print
+
+ADD_MONITOR_COMMAND = 'add'
+REMOVE_MONITOR_COMMAND = 'remove'
+
+
+class SystemMonitorsMultiplexer(PublisherComponent):
+    """
+    Runs the monitoring round of many system monitors from a single process.
+    The node exporters are scraped concurrently, and the results are processed
+    and published sequentially on one shared RabbitMQ connection. Monitors are
+    added and removed through commands sent by the system monitors manager.
+    """
+
+    def __init__(self, name: str, logger: logging.Logger, monitor_period: int,
+                 rabbitmq: RabbitMQApi, commands: multiprocessing.Queue,
+                 max_concurrent_scrapes: int = 50) -> None:
+        """
+        :param name: The name of the multiplexer
+        :param logger: The logger object to log with
+        :param monitor_period: The time to wait between monitoring rounds
+        :param rabbitmq: The rabbit MQ connection shared by all monitors
+        :param commands: The queue from which add/remove commands are read
+        :param max_concurrent_scrapes: The maximum number of node exporters
+        scraped at the same time
+        """
+        self._name = name
+        self._monitor_period = monitor_period
+        self._commands = commands
+        self._monitors = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_scrapes)
+        self._loop = asyncio.new_event_loop()
+
+        super().__init__(logger, rabbitmq)
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def monitor_period(self) -> int:
+        return self._monitor_period
+
+    @property
+    def monitors(self) -> Dict[str, SystemMonitor]:
+        return self._monitors
+
+    def _initialise_rabbitmq(self) -> None:
+        self.rabbitmq.connect_till_successful()
+        self.logger.info("Setting delivery confirmation on RabbitMQ channel")
+        self.rabbitmq.confirm_delivery()
+        self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
+        self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, 'direct', False,
+                                       True, False, False)
+        self.logger.info("Creating '%s' exchange", HEALTH_CHECK_EXCHANGE)
+        self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
+                                       True, False, False)
+
+    def _add_monitor(self, config_id: str, system_config: SystemConfig) \
+            -> None:
+        monitor_name = SYSTEM_MONITOR_NAME_TEMPLATE.format(
+            system_config.system_name)
+        monitor = SystemMonitor(monitor_name, system_config,
+                                self.logger.getChild(monitor_name),
+                                self.monitor_period, self.rabbitmq)
+
+        # Creating a monitor registers its own termination handlers, therefore
+        # point them back to the multiplexer.
+        Component.__init__(self)
+
+        if config_id in self.monitors:
+            log_and_print("Replacing the monitor of {} with the latest "
+                          "configuration".format(config_id), self.logger)
+        else:
+            log_and_print("Added {} to {}".format(monitor_name, self),
+                          self.logger)
+        self._monitors[config_id] = monitor
+
+    def _remove_monitor(self, config_id: str) -> None:
+        if config_id in self.monitors:
+            monitor = self._monitors.pop(config_id)
+            log_and_print("Removed {} from {}".format(monitor, self),
+                          self.logger)
+
+    def _process_commands(self) -> None:
+        # Apply all the commands sent by the manager since the last round
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                break
+
+            self.logger.debug("Received command %s", command)
+            if command['action'] == ADD_MONITOR_COMMAND:
+                self._add_monitor(command['config_id'],
+                                  command['system_config'])
+            elif command['action'] == REMOVE_MONITOR_COMMAND:
+                self._remove_monitor(command['config_id'])
+            else:
+                self.logger.error("Received unknown command %s", command)
+
+    async def _retrieve_all_data(self, monitors: List[SystemMonitor]) \
+            -> List[Tuple[Optional[Dict], bool, Optional[PANICException]]]:
+        # The scrapes are blocking, therefore they are executed by the thread
+        # pool. The number of workers in the pool bounds the concurrency.
+        retrievals = [
+            self._loop.run_in_executor(self._executor, monitor._retrieve_data)
+            for monitor in monitors
+        ]
+        return await asyncio.gather(*retrievals)
+
+    def _send_data(self) -> None:
+        # Each monitor publishes its own data
+        pass
+
+    def _send_heartbeat(self, data_to_send: dict) -> None:
+        self.rabbitmq.basic_publish_confirm(
+            exchange=HEALTH_CHECK_EXCHANGE, routing_key='heartbeat.worker',
+            body=data_to_send, is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+        self.logger.debug("Sent heartbeat to '%s' exchange",
+                          HEALTH_CHECK_EXCHANGE)
+
+    def _monitor(self) -> None:
+        self._process_commands()
+
+        monitors = list(self.monitors.values())
+        retrieved_data = self._loop.run_until_complete(
+            self._retrieve_all_data(monitors))
+
+        # Processing and publishing is done sequentially because the RabbitMQ
+        # connection cannot be shared between threads.
+        for monitor, (data, data_retrieval_failed,
+                      data_retrieval_exception) in zip(monitors,
+                                                       retrieved_data):
+            try:
+                monitor._process_and_send_data(data, data_retrieval_failed,
+                                               data_retrieval_exception)
+            except MessageWasNotDeliveredException as e:
+                # Do not let the other monitors miss their round because the
+                # message of one monitor could not be delivered.
+                monitor.logger.exception(e)
+
+        heartbeat = {
+            'component_name': self.name,
+            'is_alive': True,
+            'timestamp': datetime.now().timestamp()
+        }
+        self._send_heartbeat(heartbeat)
+
+    def start(self) -> None:
+        self._initialise_rabbitmq()
+        while True:
+            try:
+                self._monitor()
+            except MessageWasNotDeliveredException as e:
+                self.logger.exception(e)
+            except (pika.exceptions.AMQPConnectionError,
+                    pika.exceptions.AMQPChannelError) as e:
+                # If we have either a channel error or connection error, the
+                # channel is reset, therefore we need to re-initialise the
+                # connection or channel settings
+                raise e
+            except Exception as e:
+                self.logger.exception(e)
+                raise e
+
+            self.logger.debug("Sleeping for %s seconds.", self.monitor_period)
+
+            # Use the BlockingConnection sleep to avoid dropped connections
+            self.rabbitmq.connection.sleep(self.monitor_period)
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        log_and_print("{} is terminating. Connections with RabbitMQ will be "
+                      "closed, and afterwards the process will exit."
+                      .format(self), self.logger)
+        self.disconnect_from_rabbit()
+        self._executor.shutdown(wait=False)
+        log_and_print("{} terminated.".format(self), self.logger)
+        sys.exit()
@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import time
 from typing import TypeVar, Type, Union
 
@@ -8,13 +9,17 @@ from src.configs.repo import RepoConfig
 from src.configs.system import SystemConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.github import GitHubMonitor
+from src.monitors.github_graphql import GitHubGraphQLMonitor
 from src.monitors.monitor import Monitor
+from src.monitors.multiplexer import SystemMonitorsMultiplexer
 from src.monitors.system import SystemMonitor
 from src.utils import env
 from src.utils.constants import (RE_INITIALISE_SLEEPING_PERIOD,
                                  RESTART_SLEEPING_PERIOD,
                                  SYSTEM_MONITOR_NAME_TEMPLATE,
-                                 GITHUB_MONITOR_NAME_TEMPLATE)
+                                 GITHUB_MONITOR_NAME_TEMPLATE,
+                                 SYSTEM_MONITORS_MULTIPLEXER_NAME,
+                                 GITHUB_GRAPHQL_MONITOR_NAME)
 from src.utils.logging import create_logger, log_and_print
 from src.utils.starters import (get_initialisation_error_message,
                                 get_stopped_message)
@@ -81,6 +86,39 @@ def start_system_monitor(system_config: SystemConfig) -> None:
     start_monitor(system_monitor)
 
 
+def _initialise_system_monitors_multiplexer(
+        commands: multiprocessing.Queue) -> SystemMonitorsMultiplexer:
+    multiplexer_display_name = SYSTEM_MONITORS_MULTIPLEXER_NAME
+    multiplexer_logger = _initialise_monitor_logger(
+        multiplexer_display_name, SystemMonitorsMultiplexer.__name__)
+
+    # Try initialising the multiplexer until successful
+    while True:
+        try:
+            rabbitmq = RabbitMQApi(
+                logger=multiplexer_logger.getChild(RabbitMQApi.__name__),
+                host=env.RABBIT_IP)
+            multiplexer = SystemMonitorsMultiplexer(
+                multiplexer_display_name, multiplexer_logger,
+                env.SYSTEM_MONITOR_PERIOD_SECONDS, rabbitmq, commands,
+                env.SYSTEM_MONITORS_MAX_CONCURRENT_SCRAPES)
+            log_and_print("Successfully initialised {}".format(
+                multiplexer_display_name), multiplexer_logger)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(multiplexer_display_name, e)
+            log_and_print(msg, multiplexer_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return multiplexer
+
+
+def start_system_monitors_multiplexer(commands: multiprocessing.Queue) -> None:
+    multiplexer = _initialise_system_monitors_multiplexer(commands)
+    start_monitor(multiplexer)
+
+
 def start_github_monitor(repo_config: RepoConfig) -> None:
     # Monitor display name based on repo name. The '/' are replaced with spaces,
     # and the last space is removed.
@@ -92,7 +130,41 @@ def start_github_monitor(repo_config: RepoConfig) -> None:
     start_monitor(github_monitor)
 
 
-def start_monitor(monitor: Monitor) -> None:
+def _initialise_github_graphql_monitor(
+        commands: multiprocessing.Queue) -> GitHubGraphQLMonitor:
+    monitor_display_name = GITHUB_GRAPHQL_MONITOR_NAME
+    monitor_logger = _initialise_monitor_logger(
+        monitor_display_name, GitHubGraphQLMonitor.__name__)
+
+    # Try initialising the monitor until successful
+    while True:
+        try:
+            rabbitmq = RabbitMQApi(
+                logger=monitor_logger.getChild(RabbitMQApi.__name__),
+                host=env.RABBIT_IP)
+            github_graphql_monitor = GitHubGraphQLMonitor(
+                monitor_display_name, monitor_logger,
+                env.GITHUB_MONITOR_PERIOD_SECONDS, rabbitmq, commands,
+                env.GITHUB_API_TOKEN, env.GITHUB_GRAPHQL_BATCH_SIZE)
+            log_and_print("Successfully initialised {}".format(
+                monitor_display_name), monitor_logger)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(monitor_display_name, e)
+            log_and_print(msg, monitor_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return github_graphql_monitor
+
+
+def start_github_graphql_monitor(commands: multiprocessing.Queue) -> None:
+    github_graphql_monitor = _initialise_github_graphql_monitor(commands)
+    start_monitor(github_graphql_monitor)
+
+
+def start_monitor(monitor: Union[Monitor, SystemMonitorsMultiplexer,
+                                 GitHubGraphQLMonitor]) -> None:
     while True:
         try:
             log_and_print("{} started.".format(monitor), monitor.logger)
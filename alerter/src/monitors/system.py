@@ -1,9 +1,8 @@
-import copy
 import json
 import logging
 from datetime import datetime
 from http.client import IncompleteRead
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 import pika
 import pika.exceptions
@@ -93,8 +92,6 @@ class SystemMonitor(Monitor):
         return processed_data
 
     def _process_retrieved_data(self, data: Dict) -> Dict:
-        data_copy = copy.deepcopy(data)
-
         # Add some meta-data to the processed data
         processed_data = {
             'result': {
@@ -110,16 +107,15 @@ class SystemMonitor(Monitor):
         }
 
         # Add process CPU seconds total to the processed data
-        process_cpu_seconds_total = data_copy['process_cpu_seconds_total']
+        process_cpu_seconds_total = data['process_cpu_seconds_total']
         self.logger.debug("%s process_cpu_seconds_total: %s",
                           self.system_config, process_cpu_seconds_total)
         processed_data['result']['data']['process_cpu_seconds_total'] = \
             process_cpu_seconds_total
 
         # Add process memory usage percentage to the processed data
-        process_memory_usage = (data_copy['go_memstats_alloc_bytes'] /
-                                data_copy[
-                                    'go_memstats_alloc_bytes_total']) * 100
+        process_memory_usage = (data['go_memstats_alloc_bytes'] /
+                                data['go_memstats_alloc_bytes_total']) * 100
         process_memory_usage = float("{:.2f}".format(process_memory_usage))
         self.logger.debug("%s process_memory_usage: %s", self.system_config,
                           process_memory_usage)
@@ -127,7 +123,7 @@ class SystemMonitor(Monitor):
             process_memory_usage
 
         # Add virtual memory usage to the processed data
-        virtual_memory_usage = data_copy['process_virtual_memory_bytes']
+        virtual_memory_usage = data['process_virtual_memory_bytes']
         self.logger.debug("%s virtual_memory_usage: %s", self.system_config,
                           virtual_memory_usage)
         processed_data['result']['data']['virtual_memory_usage'] = \
@@ -135,7 +131,7 @@ class SystemMonitor(Monitor):
 
         # Add open file descriptors percentage to the processed data
         open_file_descriptors = \
-            (data_copy['process_open_fds'] / data_copy['process_max_fds']) * 100
+            (data['process_open_fds'] / data['process_max_fds']) * 100
         self.logger.debug("%s open_file_descriptors: %s", self.system_config,
                           open_file_descriptors)
         processed_data['result']['data']['open_file_descriptors'] = \
@@ -146,12 +142,12 @@ class SystemMonitor(Monitor):
         # the time in idle mode
         node_cpu_seconds_idle = 0
         node_cpu_seconds_total = 0
-        for _, data_subset in enumerate(data_copy['node_cpu_seconds_total']):
+        for _, data_subset in enumerate(data['node_cpu_seconds_total']):
             if json.loads(data_subset)['mode'] == 'idle':
                 node_cpu_seconds_idle += \
-                    data_copy['node_cpu_seconds_total'][data_subset]
+                    data['node_cpu_seconds_total'][data_subset]
             node_cpu_seconds_total += \
-                data_copy['node_cpu_seconds_total'][data_subset]
+                data['node_cpu_seconds_total'][data_subset]
 
         system_cpu_usage = 100 - (
                 (node_cpu_seconds_idle / node_cpu_seconds_total) * 100)
@@ -162,9 +158,9 @@ class SystemMonitor(Monitor):
             system_cpu_usage
 
         # Add system RAM usage percentage to processed data
-        system_ram_usage = ((data_copy['node_memory_MemTotal_bytes'] -
-                             data_copy['node_memory_MemAvailable_bytes']) /
-                            data_copy['node_memory_MemTotal_bytes']) * 100
+        system_ram_usage = ((data['node_memory_MemTotal_bytes'] -
+                             data['node_memory_MemAvailable_bytes']) /
+                            data['node_memory_MemTotal_bytes']) * 100
         system_ram_usage = float("{:.2f}".format(system_ram_usage))
         self.logger.debug("%s system_ram_usage: %s", self.system_config,
                           system_ram_usage)
@@ -174,14 +170,14 @@ class SystemMonitor(Monitor):
         node_filesystem_avail_bytes = 0
         node_filesystem_size_bytes = 0
         for _, data_subset in enumerate(
-                data_copy['node_filesystem_avail_bytes']):
+                data['node_filesystem_avail_bytes']):
             node_filesystem_avail_bytes += \
-                data_copy['node_filesystem_avail_bytes'][data_subset]
+                data['node_filesystem_avail_bytes'][data_subset]
 
         for _, data_subset in enumerate(
-                data_copy['node_filesystem_size_bytes']):
+                data['node_filesystem_size_bytes']):
             node_filesystem_size_bytes += \
-                data_copy['node_filesystem_size_bytes'][data_subset]
+                data['node_filesystem_size_bytes'][data_subset]
 
         system_storage_usage = 100 - (
                 (node_filesystem_avail_bytes / node_filesystem_size_bytes)
@@ -197,14 +193,14 @@ class SystemMonitor(Monitor):
         receive_bytes_total = 0
         transmit_bytes_total = 0
         for _, data_subset in enumerate(
-                data_copy['node_network_receive_bytes_total']):
+                data['node_network_receive_bytes_total']):
             receive_bytes_total += \
-                data_copy['node_network_receive_bytes_total'][data_subset]
+                data['node_network_receive_bytes_total'][data_subset]
 
         for _, data_subset in enumerate(
-                data_copy['node_network_transmit_bytes_total']):
+                data['node_network_transmit_bytes_total']):
             transmit_bytes_total += \
-                data_copy['node_network_transmit_bytes_total'][data_subset]
+                data['node_network_transmit_bytes_total'][data_subset]
 
         self.logger.debug("%s network_receive_bytes_total: %s, "
                           "network_transmit_bytes_total: %s",
@@ -218,9 +214,9 @@ class SystemMonitor(Monitor):
         # Add the time spent in seconds doing disk i/o to the processed data.
         disk_io_time_seconds_total = 0
         for _, data_subset in enumerate(
-                data_copy['node_disk_io_time_seconds_total']):
+                data['node_disk_io_time_seconds_total']):
             disk_io_time_seconds_total += \
-                data_copy['node_disk_io_time_seconds_total'][data_subset]
+                data['node_disk_io_time_seconds_total'][data_subset]
 
         self.logger.debug("%s disk_io_time_seconds_total: %s",
                           self.system_config, disk_io_time_seconds_total)
@@ -236,7 +232,12 @@ class SystemMonitor(Monitor):
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
 
-    def _monitor(self) -> None:
+    def _retrieve_data(self) -> Tuple[Optional[Dict], bool,
+                                      Optional[PANICException]]:
+        # Retrieves the data and converts any retrieval errors into the
+        # respective PANIC exception. This was separated from the rest of the
+        # monitoring round so that retrievals of many systems can be performed
+        # concurrently (see SystemMonitorsMultiplexer).
         data_retrieval_exception = None
         data = None
         data_retrieval_failed = False
@@ -270,6 +271,11 @@ class SystemMonitor(Monitor):
                               self.system_config.node_exporter_url)
             self.logger.exception(data_retrieval_exception)
 
+        return data, data_retrieval_failed, data_retrieval_exception
+
+    def _process_and_send_data(
+            self, data: Optional[Dict], data_retrieval_failed: bool,
+            data_retrieval_exception: Optional[PANICException]) -> None:
         try:
             processed_data = self._process_data(data, data_retrieval_failed,
                                                 data_retrieval_exception)
@@ -294,3 +300,9 @@ class SystemMonitor(Monitor):
             'timestamp': datetime.now().timestamp()
         }
         self._send_heartbeat(heartbeat)
+
+    def _monitor(self) -> None:
+        data, data_retrieval_failed, data_retrieval_exception = \
+            self._retrieve_data()
+        self._process_and_send_data(data, data_retrieval_failed,
+                                    data_retrieval_exception)
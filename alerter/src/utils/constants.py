@@ -57,6 +57,15 @@ CHANNELS_MANAGER_CONFIG_ROUTING_KEY = 'channels.*'
 RESTART_SLEEPING_PERIOD = 10
 RE_INITIALISE_SLEEPING_PERIOD = 10
 
+# HTTP connection pooling
+HTTP_POOL_MAX_HOSTS = 100
+HTTP_POOL_MAX_CONNECTIONS_PER_HOST = 10
+HTTP_MAX_DRAINED_BYTES = 64 * 1024
+
+# GitHub API
+GITHUB_GRAPHQL_API_URL = 'https://api.github.com/graphql'
+GITHUB_RELEASES_PAGE_SIZE = 30
+
 # Templates
 EMAIL_HTML_TEMPLATE = """<style type="text/css">
 .email {{font-family: sans-serif}}
@@ -119,7 +128,9 @@ ALERT_STORE_NAME = 'Alert Store'
 SYSTEM_DATA_TRANSFORMER_NAME = 'System Data Transformer'
 GITHUB_DATA_TRANSFORMER_NAME = 'GitHub Data Transformer'
 SYSTEM_MONITORS_MANAGER_NAME = 'System Monitors Manager'
+SYSTEM_MONITORS_MULTIPLEXER_NAME = 'System Monitors Multiplexer'
 GITHUB_MONITORS_MANAGER_NAME = 'GitHub Monitors Manager'
+GITHUB_GRAPHQL_MONITOR_NAME = 'GitHub GraphQL Monitor'
 DATA_TRANSFORMERS_MANAGER_NAME = 'Data Transformers Manager'
 SYSTEM_ALERTERS_MANAGER_NAME = 'System Alerters Manager'
 GITHUB_ALERTER_MANAGER_NAME = 'GitHub Alerter Manager'
@@ -1,13 +1,19 @@
 import json
 import logging
+import re
 from enum import Enum
-from typing import Dict
-
-import requests
-from prometheus_client.parser import text_string_to_metric_families
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.utils.exceptions import (NoMetricsGivenException,
                                   MetricNotFoundException)
+from src.utils.http import get_shared_http_client
+
+# Patterns used by the Prometheus text format parser below
+_METRIC_NAME_PATTERN = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*')
+_LABEL_PATTERN = re.compile(
+    r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"\s*,?\s*')
+_LABEL_VALUE_ESCAPE_PATTERN = re.compile(r'\\(.)')
+_LABEL_VALUE_ESCAPES = {'\\': '\\', '"': '"', 'n': '\n'}
 
 
 class RequestStatus(Enum):
@@ -18,42 +24,133 @@ class RequestStatus(Enum):
 def get_json(endpoint: str, logger: logging.Logger, params=None):
     if params is None:
         params = {}
-    get_ret = requests.get(url=endpoint, params=params, timeout=15)
-    logger.debug("get_json: get_ret: %s", get_ret)
-    return json.loads(get_ret.content.decode('UTF-8'))
+    with get_shared_http_client().get(endpoint, logger, timeout=15,
+                                      params=params) as get_ret:
+        logger.debug("get_json: get_ret: %s", get_ret)
+        content = get_ret.content
+    return json.loads(content.decode('UTF-8'))
+
+
+def get_json_if_modified(endpoint: str, logger: logging.Logger,
+                         etag: Optional[str], params=None) \
+        -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Sends a conditional request using the ETag of the last response, if any.
+    :return: The decoded JSON and the ETag of the response, or None and the
+           : given ETag if the server replied that nothing was modified
+    """
+    if params is None:
+        params = {}
+    headers = {} if etag is None else {'If-None-Match': etag}
+    with get_shared_http_client().get(endpoint, logger, timeout=15,
+                                      params=params,
+                                      headers=headers) as get_ret:
+        logger.debug("get_json_if_modified: get_ret: %s", get_ret)
+        if get_ret.status_code == 304:
+            return None, etag
+        content = get_ret.content
+        new_etag = get_ret.headers.get('ETag') \
+            if get_ret.status_code == 200 else etag
+    return json.loads(content.decode('UTF-8')), new_etag
 
 
 def get_prometheus(endpoint: str, logger: logging.Logger):
-    metrics = requests.get(endpoint, timeout=10).content
+    with get_shared_http_client().get(endpoint, logger, timeout=10) as response:
+        metrics = response.content
     logger.debug("Retrieved prometheus data from endpoint: " + endpoint)
     return metrics.decode('utf-8')
 
 
+def _unescape_label_value(value: str) -> str:
+    if '\\' not in value:
+        return value
+    return _LABEL_VALUE_ESCAPE_PATTERN.sub(
+        lambda match: _LABEL_VALUE_ESCAPES.get(match.group(1),
+                                               match.group(0)), value)
+
+
+def _parse_prometheus_sample(line: str, name_end: int) \
+        -> Tuple[Dict[str, str], float]:
+    # Parses the labels and the value of a sample line, given the index at
+    # which the metric name ends. Any timestamp is ignored.
+    labels = {}
+    position = name_end
+    if line.startswith('{', position):
+        position += 1
+        while not line.startswith('}', position):
+            match = _LABEL_PATTERN.match(line, position)
+            if match is None:
+                raise ValueError("Invalid labels in line: " + line)
+            labels[match.group(1)] = _unescape_label_value(match.group(2))
+            position = match.end()
+        position += 1
+
+    return labels, float(line[position:].split()[0])
+
+
+def parse_prometheus_metrics(lines: Iterable[str],
+                             requested_metrics: List[str]) -> Dict:
+    """
+    Parses the Prometheus text exposition format line by line, only building
+    the samples of the requested metrics. The lines of other metrics are
+    skipped after reading their name. Since the samples of a metric are
+    grouped together, parsing stops at the first metric after all the
+    requested metrics have been seen.
+    :param lines: The lines of the exposition
+    :param requested_metrics: The names of the samples to return
+    :return: A dict mapping each metric name to its value if the samples have
+           : no labels, or to a dict mapping the JSON encoded labels to the
+           : value of each sample otherwise
+    """
+    requested = set(requested_metrics)
+    response = {}
+    for line in lines:
+        if line.startswith('#'):
+            # HELP and TYPE lines mark the start of a metric family
+            parts = line.split(None, 3)
+            if len(parts) < 3 or parts[1] not in ('HELP', 'TYPE'):
+                continue
+            name = parts[2]
+            if name not in requested and len(response) == len(requested):
+                break
+            continue
+
+        match = _METRIC_NAME_PATTERN.match(line)
+        if match is None:
+            # Blank or invalid line
+            continue
+
+        name = match.group()
+        if name not in requested:
+            if len(response) == len(requested):
+                break
+            continue
+
+        labels, value = _parse_prometheus_sample(line, match.end())
+        if labels != {}:
+            if name not in response:
+                response[name] = {}
+            response[name][json.dumps(labels)] = value
+        elif name not in response:
+            response[name] = value
+        else:
+            response[name] = value + response[name]
+
+    return response
+
+
 def get_prometheus_metrics_data(endpoint: str, requested_metrics: list,
                                 logger: logging.Logger) -> Dict:
-    response = {}
     if len(requested_metrics) == 0:
         raise NoMetricsGivenException("No metrics given when requesting"
                                       "prometheus data from " + endpoint)
 
-    metrics = get_prometheus(endpoint, logger)
-    for family in text_string_to_metric_families(metrics):
-        for sample in family.samples:
-            if sample.name in requested_metrics:
-                if sample.name not in response:
-                    if sample.labels != {}:
-                        response[sample.name] = {}
-                        response[sample.name][json.dumps(sample.labels)] = \
-                            sample.value
-                    else:
-                        response[sample.name] = sample.value
-                else:
-                    if sample.labels != {}:
-                        response[sample.name][json.dumps(sample.labels)] = \
-                            sample.value
-                    else:
-                        response[sample.name] = sample.value + \
-                                                response[sample.name]
+    # The response is streamed so that it is parsed as it is downloaded, and
+    # the download is stopped once all the requested metrics are obtained.
+    with get_shared_http_client().get(endpoint, logger, timeout=10) as metrics:
+        lines = (line.decode('utf-8') for line in metrics.iter_lines())
+        response = parse_prometheus_metrics(lines, requested_metrics)
+    logger.debug("Retrieved prometheus data from endpoint: " + endpoint)
 
     # Raises a meaningful exception if some requested metrics are not found at
     # the endpoint
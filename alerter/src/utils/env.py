@@ -51,6 +51,31 @@ SYSTEM_MONITOR_PERIOD_SECONDS = int(os.environ['SYSTEM_MONITOR_PERIOD_SECONDS'])
 GITHUB_MONITOR_PERIOD_SECONDS = int(os.environ['GITHUB_MONITOR_PERIOD_SECONDS'])
 # These define how often a monitor runs an iteration of its monitoring loop
 
+# GitHub GraphQL monitoring
+USE_GITHUB_GRAPHQL_API: bool = \
+    os.getenv('USE_GITHUB_GRAPHQL_API', 'False').lower() in ("true", "yes", "y")
+GITHUB_API_TOKEN = os.getenv('GITHUB_API_TOKEN', '')
+GITHUB_GRAPHQL_BATCH_SIZE = int(os.getenv('GITHUB_GRAPHQL_BATCH_SIZE', 50))
+# If enabled, all repos are monitored by a single process which requests the
+# releases of GITHUB_GRAPHQL_BATCH_SIZE repos per GraphQL query. The GraphQL API
+# requires a GitHub token.
+
+# System monitors multiplexing
+MULTIPLEX_SYSTEM_MONITORS: bool = \
+    os.getenv('MULTIPLEX_SYSTEM_MONITORS', 'False').lower() in (
+        "true", "yes", "y")
+SYSTEM_MONITORS_MAX_CONCURRENT_SCRAPES = int(
+    os.getenv('SYSTEM_MONITORS_MAX_CONCURRENT_SCRAPES', 50))
+# If enabled, all systems are monitored by a single process which scrapes at
+# most SYSTEM_MONITORS_MAX_CONCURRENT_SCRAPES node exporters concurrently
+
+# Data transformers state
+PRE_HYDRATE_SYSTEM_TRANSFORMER_STATE: bool = \
+    os.getenv('PRE_HYDRATE_SYSTEM_TRANSFORMER_STATE', 'False').lower() in (
+        "true", "yes", "y")
+# If enabled, the System Data Transformer loads the state of all systems from
+# Redis with one HGETALL per parent hash when it starts
+
 # Publishers limits
 DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE'])
@@ -59,6 +84,10 @@ CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE'])
 ALERT_ROUTER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['ALERT_ROUTER_PUBLISHING_QUEUE_SIZE'])
+PUBLISHER_CONFIRMS_WINDOW_SIZE = int(
+    os.getenv('PUBLISHER_CONFIRMS_WINDOW_SIZE', 0))
+# If greater than 0, the data transformers and the alert router publish up to
+# this many messages before waiting for their publisher confirms
 
 # Console Output
 ENABLE_CONSOLE_ALERTS: bool = \
@@ -0,0 +1,203 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import ContextManager, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.utils.constants import (HTTP_POOL_MAX_HOSTS,
+                                 HTTP_POOL_MAX_CONNECTIONS_PER_HOST,
+                                 HTTP_MAX_DRAINED_BYTES)
+
+# Connections are opened by the thread performing the request, therefore the
+# time spent connecting is accumulated per thread.
+_connection_timing = threading.local()
+
+
+class _TimedConnectionMixin:
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        _connection_timing.connect_time = \
+            getattr(_connection_timing, 'connect_time', 0.0) \
+            + (time.perf_counter() - start)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class RequestTimings:
+    """
+    The time in seconds spent in each phase of a request. The connect time is
+    0 if an idle connection was reused. The time to first byte is measured
+    from the start of the request, therefore it includes the connect time.
+    """
+
+    def __init__(self, connect_time: float, time_to_first_byte: float,
+                 transfer_time: float) -> None:
+        self._connect_time = connect_time
+        self._time_to_first_byte = time_to_first_byte
+        self._transfer_time = transfer_time
+
+    def __str__(self) -> str:
+        return "connect={:.1f}ms, ttfb={:.1f}ms, transfer={:.1f}ms".format(
+            self.connect_time * 1000, self.time_to_first_byte * 1000,
+            self.transfer_time * 1000)
+
+    @property
+    def connect_time(self) -> float:
+        return self._connect_time
+
+    @property
+    def time_to_first_byte(self) -> float:
+        return self._time_to_first_byte
+
+    @property
+    def transfer_time(self) -> float:
+        return self._transfer_time
+
+    @property
+    def total_time(self) -> float:
+        return self.time_to_first_byte + self.transfer_time
+
+    @property
+    def reused_connection(self) -> bool:
+        return self.connect_time == 0
+
+
+class HTTPClient:
+    """
+    Performs HTTP GET requests over a pool of keep-alive connections, so that
+    monitors do not open a new connection (and do a TLS handshake) every
+    monitoring round. At most `max_connections_per_host` connections are
+    opened to the same host, further requests wait for a free connection. The
+    timings of the last request to each URL are recorded.
+    """
+
+    def __init__(self, max_hosts: int = HTTP_POOL_MAX_HOSTS,
+                 max_connections_per_host: int =
+                 HTTP_POOL_MAX_CONNECTIONS_PER_HOST) -> None:
+        self._session = requests.Session()
+        adapter = _TimedHTTPAdapter(pool_connections=max_hosts,
+                                    pool_maxsize=max_connections_per_host,
+                                    pool_block=True)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._last_timings = {}
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    @property
+    def last_timings(self) -> Dict[str, RequestTimings]:
+        return self._last_timings
+
+    @staticmethod
+    def _release(response: requests.Response) -> None:
+        # A connection can only be reused once its response is fully read. If
+        # the reader stopped early, the rest of a small body is read so that
+        # the connection is kept, otherwise the connection is closed.
+        try:
+            drained = 0
+            while drained <= HTTP_MAX_DRAINED_BYTES:
+                chunk = response.raw.read(8192)
+                if not chunk:
+                    break
+                drained += len(chunk)
+        except Exception:
+            pass
+        response.close()
+
+    @contextmanager
+    def _request(self, method: str, url: str, logger: logging.Logger,
+                 timeout: float, **kwargs) -> Iterator[requests.Response]:
+        _connection_timing.connect_time = 0.0
+        start = time.perf_counter()
+        response = self._session.request(method, url, timeout=timeout,
+                                         stream=True, **kwargs)
+        first_byte_time = time.perf_counter()
+        try:
+            yield response
+        finally:
+            self._release(response)
+            timings = RequestTimings(_connection_timing.connect_time,
+                                     first_byte_time - start,
+                                     time.perf_counter() - first_byte_time)
+            self._last_timings[url] = timings
+            logger.debug("Request timings for %s: %s", url, timings)
+
+    def get(self, url: str, logger: logging.Logger, timeout: float,
+            params: Optional[Dict] = None,
+            headers: Optional[Dict] = None) \
+            -> ContextManager[requests.Response]:
+        """
+        Sends a GET request and yields the response before its body is read,
+        so that the body can be streamed. The connection is returned to the
+        pool when the context is exited.
+        :param url: The URL to request
+        :param logger: The logger used to log the timings of the request
+        :param timeout: The connect and read timeout in seconds
+        :param params: The query parameters
+        :param headers: Extra headers to send with the request
+        """
+        return self._request('GET', url, logger, timeout, params=params,
+                             headers=headers)
+
+    def post(self, url: str, logger: logging.Logger, timeout: float,
+             json: Optional[Dict] = None,
+             headers: Optional[Dict] = None) \
+            -> ContextManager[requests.Response]:
+        """
+        Sends a POST request with a JSON body, in the same way as get.
+        :param url: The URL to request
+        :param logger: The logger used to log the timings of the request
+        :param timeout: The connect and read timeout in seconds
+        :param json: The body to send encoded as JSON
+        :param headers: Extra headers to send with the request
+        """
+        return self._request('POST', url, logger, timeout, json=json,
+                             headers=headers)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> HTTPClient:
+    # The client is created on first use so that every process has its own
+    # connections. Within a process, all monitors share the client.
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HTTPClient()
+        return _shared_client
@@ -194,6 +194,53 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
             self.redis.hget_unsafe(self.hash_name, self.key1,
                                    default=self.default_str))
 
+    def test_mget_unsafe_returns_only_set_keys(self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.redis.set_unsafe(self.key2, 'None')
+        self.assertEqual(
+            self.redis.mget_unsafe([self.key1, self.key2, self.key3]),
+            {self.key1: self.val1_bytes, self.key2: None})
+
+    def test_execute_batch_unsafe_returns_result_of_each_command(self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key2, self.val2)
+        self.assertEqual(
+            self.redis.execute_batch_unsafe([
+                ('get', [self.key1]),
+                ('get', [self.key3, self.default_str]),
+                ('hget', [self.hash_name, self.key2]),
+                ('mget', [[self.key1, self.key3]]),
+                ('hmget', [self.hash_name, [self.key1, self.key2]]),
+                ('hgetall', [self.hash_name]),
+                ('exists', [self.key1]),
+                ('hexists', [self.hash_name, self.key1]),
+            ]),
+            [self.val1_bytes, self.default_str, self.val2_bytes,
+             {self.key1: self.val1_bytes}, {self.key2: self.val2_bytes},
+             {self.key2: self.val2_bytes}, True, False])
+
+    def test_execute_batch_unsafe_raises_value_error_for_unknown_command(
+            self):
+        self.assertRaises(ValueError, self.redis.execute_batch_unsafe,
+                          [('set', [self.key1, self.val1])])
+
+    def test_hmget_unsafe_returns_only_set_keys(self):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key2, 'None')
+        self.assertEqual(
+            self.redis.hmget_unsafe(self.hash_name,
+                                    [self.key1, self.key2, self.key3]),
+            {self.key1: self.val1_bytes, self.key2: None})
+
+    def test_hgetall_unsafe_returns_all_keys_of_hash(self):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key2, 'None')
+        self.assertEqual(self.redis.hgetall_unsafe(self.hash_name),
+                         {self.key1: self.val1_bytes, self.key2: None})
+
+    def test_hgetall_unsafe_returns_empty_dict_for_unset_hash(self):
+        self.assertEqual(self.redis.hgetall_unsafe(self.hash_name), {})
+
     def test_get_int_unsafe_returns_set_integer(self):
         self.redis.set_unsafe(self.key3, self.val3_int)
         self.assertEqual(
@@ -483,6 +530,50 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
             self.redis.hget(self.hash_name, self.key1,
                             default=self.default_str), self.default_str)
 
+    def test_mget_returns_only_set_keys(self):
+        self.redis.set(self.key1, self.val1)
+        self.assertEqual(self.redis.mget([self.key1, self.key2]),
+                         {self.key1: self.val1_bytes})
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_mget_returns_empty_dict_if_redis_down(self, _):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.assertEqual(self.redis.mget([self.key1, self.key2]), {})
+
+    def test_execute_batch_returns_result_of_each_command(self):
+        self.redis.set(self.key1, self.val1)
+        self.assertEqual(
+            self.redis.execute_batch([('get', [self.key1]),
+                                      ('exists', [self.key2])]),
+            [self.val1_bytes, False])
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_execute_batch_returns_none_if_redis_down(self, _):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.assertIsNone(self.redis.execute_batch([('get', [self.key1])]))
+
+    def test_hmget_returns_only_set_keys(self):
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.assertEqual(
+            self.redis.hmget(self.hash_name, [self.key1, self.key2]),
+            {self.key1: self.val1_bytes})
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hmget_returns_empty_dict_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertEqual(
+            self.redis.hmget(self.hash_name, [self.key1, self.key2]), {})
+
+    def test_hgetall_returns_all_keys_of_hash(self):
+        self.redis.hset(self.hash_name, self.key1, self.val1)
+        self.assertEqual(self.redis.hgetall(self.hash_name),
+                         {self.key1: self.val1_bytes})
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hgetall_returns_empty_dict_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertEqual(self.redis.hgetall(self.hash_name), {})
+
     def test_get_int_returns_set_integer(self):
         self.redis.set(self.key3, self.val3_int)
         self.assertEqual(
@@ -791,6 +882,23 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
         self.assertRaises(RedisConnectionError, self.redis.hget_unsafe,
                           self.hash_name, self.key)
 
+    def test_mget_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.mget_unsafe,
+                          [self.key])
+
+    def test_hmget_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.hmget_unsafe,
+                          self.hash_name, [self.key])
+
+    def test_hgetall_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError, self.redis.hgetall_unsafe,
+                          self.hash_name)
+
+    def test_execute_batch_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError,
+                          self.redis.execute_batch_unsafe,
+                          [('get', [self.key])])
+
     def test_get_int_unsafe_throws_connection_exception(self):
         self.assertRaises(RedisConnectionError, self.redis.get_int_unsafe,
                           self.key)
@@ -896,6 +1004,18 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
             self.redis.hget_bool(self.hash_name, self.key, default=default),
             default)
 
+    def test_mget_returns_empty_dict(self):
+        self.assertEqual(self.redis.mget([self.key]), {})
+
+    def test_hmget_returns_empty_dict(self):
+        self.assertEqual(self.redis.hmget(self.hash_name, [self.key]), {})
+
+    def test_hgetall_returns_empty_dict(self):
+        self.assertEqual(self.redis.hgetall(self.hash_name), {})
+
+    def test_execute_batch_returns_none(self):
+        self.assertIsNone(self.redis.execute_batch([('get', [self.key])]))
+
     def test_exists_returns_false(self):
         self.assertFalse(self.redis.exists(self.key))
 
@@ -170,6 +170,32 @@ class TestGitHubDataTransformer(unittest.TestCase):
                 'code': self.test_exception.code,
             }
         }
+        self.raw_data_example_unchanged = {
+            'result': {
+                'meta_data': {
+                    'monitor_name': 'test_monitor',
+                    'repo_name': self.test_repo.repo_name,
+                    'repo_id': self.test_repo.repo_id,
+                    'repo_parent_id': self.test_repo.parent_id,
+                    'time': self.test_last_monitored + 60
+                },
+                'unchanged': True,
+            }
+        }
+        self.transformed_data_example_unchanged = {
+            'result': {
+                'meta_data': {
+                    'repo_name': self.test_repo.repo_name,
+                    'repo_id': self.test_repo.repo_id,
+                    'repo_parent_id': self.test_repo.parent_id,
+                    'last_monitored': self.test_last_monitored + 60
+                },
+                'data': {
+                    'no_of_releases': self.test_no_of_releases,
+                    'releases': {},
+                },
+            }
+        }
         self.test_repo_new_metrics = GitHubRepo(self.test_repo_name,
                                                 self.test_repo_id,
                                                 self.test_repo_parent_id)
@@ -572,6 +598,8 @@ class TestGitHubDataTransformer(unittest.TestCase):
          'self.transformed_data_example_result'),
         ('self.raw_data_example_error',
          'self.transformed_data_example_error'),
+        ('self.raw_data_example_unchanged',
+         'self.transformed_data_example_unchanged'),
     ])
     @mock.patch.object(GitHubDataTransformer,
                        "_process_transformed_data_for_alerting")
@@ -591,6 +619,21 @@ class TestGitHubDataTransformer(unittest.TestCase):
         self.assertDictEqual({'key_2': 'val2'}, data_for_alerting)
         self.assertDictEqual({'key_1': 'val1'}, data_for_saving)
 
+    def test_transform_data_unchanged_releases_raise_no_new_release_alert(
+            self) -> None:
+        self.test_data_transformer._state = copy.deepcopy(self.test_state)
+
+        _, data_for_alerting, data_for_saving = \
+            self.test_data_transformer._transform_data(
+                self.raw_data_example_unchanged)
+
+        no_of_releases = data_for_alerting['result']['data']['no_of_releases']
+        self.assertEqual(no_of_releases['previous'], no_of_releases['current'])
+        self.assertEqual({}, data_for_alerting['result']['data']['releases'])
+        self.assertEqual(
+            self.test_no_of_releases,
+            data_for_saving['result']['data']['no_of_releases'])
+
     def test_transform_data_raises_unexpected_data_exception_on_unexpected_data(
             self) -> None:
         self.assertRaises(ReceivedUnexpectedDataException,
@@ -631,14 +674,14 @@ class TestGitHubDataTransformer(unittest.TestCase):
         expected_data_for_alerting = {
             'exchange': ALERT_EXCHANGE,
             'routing_key': 'alerter.github',
-            'data': eval(data_for_alerting),
+            'data': json.dumps(eval(data_for_alerting)),
             'properties': pika.BasicProperties(delivery_mode=2),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': 'github',
-            'data': eval(data_for_saving),
+            'data': json.dumps(eval(data_for_saving)),
             'properties': pika.BasicProperties(delivery_mode=2),
             'mandatory': True
         }
@@ -14,6 +14,7 @@ from freezegun import freeze_time
 from parameterized import parameterized
 
 from src.data_store.redis import RedisApi
+from src.data_store.redis.store_keys import Keys
 from src.data_transformers.system import (SystemDataTransformer,
                                           SYSTEM_DT_INPUT_QUEUE,
                                           SYSTEM_DT_INPUT_ROUTING_KEY)
@@ -695,6 +696,67 @@ class TestSystemDataTransformer(unittest.TestCase):
                          loaded_system.disk_io_time_seconds_total)
         self.assertEqual(self.test_last_monitored, loaded_system.last_monitored)
 
+    @mock.patch.object(RedisApi, "hmget")
+    def test_load_state_gets_all_stored_fields_with_a_single_hmget(
+            self, mock_hmget) -> None:
+        redis_hash = Keys.get_hash_parent(self.test_system_parent_id)
+        mock_hmget.return_value = {
+            Keys.get_system_system_cpu_usage(self.test_system_id): b'55.5',
+            Keys.get_system_went_down_at(self.test_system_id): None,
+        }
+
+        loaded_system = self.test_data_transformer.load_state(self.test_system)
+
+        mock_hmget.assert_called_once()
+        args, _ = mock_hmget.call_args
+        self.assertEqual(redis_hash, args[0])
+        self.assertEqual(15, len(args[1]))
+        self.assertEqual(55.5, loaded_system.system_cpu_usage)
+        self.assertEqual(None, loaded_system.went_down_at)
+        # Fields which are not stored in Redis keep their state
+        self.assertEqual(self.test_system_ram_usage,
+                         loaded_system.system_ram_usage)
+        self.assertEqual(self.test_last_monitored, loaded_system.last_monitored)
+
+    @mock.patch.object(RedisApi, "hgetall")
+    @mock.patch.object(RedisApi, "get_keys")
+    def test_pre_hydrate_state_loads_every_parent_hash(
+            self, mock_get_keys, mock_hgetall) -> None:
+        hash_1 = Keys.get_hash_parent('parent_1')
+        hash_2 = Keys.get_hash_parent('parent_2')
+        mock_get_keys.return_value = [hash_1, hash_2]
+        mock_hgetall.side_effect = [{'s5_system_1': b'1.0'},
+                                    {'s5_system_2': b'2.0'}]
+
+        self.test_data_transformer.pre_hydrate_state()
+
+        mock_get_keys.assert_called_once_with(Keys.get_hash_parent('*'))
+        self.assertEqual({hash_1: {'s5_system_1': b'1.0'},
+                          hash_2: {'s5_system_2': b'2.0'}},
+                         self.test_data_transformer.pre_hydrated_hashes)
+
+    @mock.patch.object(RedisApi, "hmget")
+    def test_load_state_uses_pre_hydrated_hash_without_accessing_redis(
+            self, mock_hmget) -> None:
+        redis_hash = Keys.get_hash_parent(self.test_system_parent_id)
+        cpu_usage_key = Keys.get_system_system_cpu_usage(self.test_system_id)
+        other_system_key = Keys.get_system_system_cpu_usage('other_system')
+        self.test_data_transformer.pre_hydrated_hashes[redis_hash] = {
+            cpu_usage_key: b'55.5',
+            other_system_key: b'10.0',
+        }
+
+        loaded_system = self.test_data_transformer.load_state(self.test_system)
+
+        mock_hmget.assert_not_called()
+        self.assertEqual(55.5, loaded_system.system_cpu_usage)
+        self.assertEqual(self.test_system_ram_usage,
+                         loaded_system.system_ram_usage)
+        # Only the keys of the loaded system are removed from the hash
+        self.assertEqual(
+            {other_system_key: b'10.0'},
+            self.test_data_transformer.pre_hydrated_hashes[redis_hash])
+
     def test_update_state_raises_unexpected_data_exception_if_no_result_or_err(
             self) -> None:
         self.assertRaises(ReceivedUnexpectedDataException,
@@ -948,14 +1010,14 @@ class TestSystemDataTransformer(unittest.TestCase):
             'exchange': ALERT_EXCHANGE,
             'routing_key': 'alerter.system.{}'.format(
                 self.test_system_parent_id),
-            'data': eval(data_for_alerting),
+            'data': json.dumps(eval(data_for_alerting)),
             'properties': pika.BasicProperties(delivery_mode=2),
             'mandatory': True
         }
         expected_data_for_saving = {
             'exchange': STORE_EXCHANGE,
             'routing_key': 'system',
-            'data': eval(data_for_saving),
+            'data': json.dumps(eval(data_for_saving)),
             'properties': pika.BasicProperties(delivery_mode=2),
             'mandatory': True
         }
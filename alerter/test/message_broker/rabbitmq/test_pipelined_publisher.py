@@ -0,0 +1,205 @@
+import logging
+import unittest
+from queue import Queue
+from unittest import mock
+
+import pika
+import pika.exceptions
+
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.pipelined_publisher import PipelinedPublisher
+from src.utils.exceptions import MessageWasNotDeliveredException
+
+
+class TestPipelinedPublisher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.rabbitmq = mock.MagicMock(spec=RabbitMQApi)
+        self.rabbitmq.is_pipelined_channel_open = True
+        self.window_size = 2
+        self.test_publisher = PipelinedPublisher(
+            self.dummy_logger, self.rabbitmq, self.window_size)
+        self.publishing_queue = Queue(10)
+        self.test_data = [
+            {'exchange': 'test_exchange', 'routing_key': 'test_key',
+             'data': '{"index": %s}' % index,
+             'properties': pika.BasicProperties(delivery_mode=2),
+             'mandatory': True}
+            for index in range(5)
+        ]
+
+        # The delivery tags given to the published messages, in publishing
+        # order
+        self.published = []
+
+        def basic_publish_pipelined(exchange, routing_key, body, properties,
+                                    mandatory):
+            self.published.append(body)
+            return len(self.published)
+
+        self.rabbitmq.basic_publish_pipelined.side_effect = \
+            basic_publish_pipelined
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.rabbitmq = None
+        self.test_publisher = None
+        self.publishing_queue = None
+
+    def _queue_test_data(self) -> None:
+        for data in self.test_data:
+            self.publishing_queue.put(data)
+
+    def _confirm_all(self, acked: bool = True) -> None:
+        for delivery_tag in sorted(self.test_publisher.unconfirmed):
+            self.test_publisher._on_confirm(delivery_tag, False, acked)
+
+    def test_send_data_sends_all_data_and_empties_the_queue(self) -> None:
+        self._queue_test_data()
+        self.rabbitmq.process_data_events.side_effect = \
+            lambda time_limit: self._confirm_all()
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.assertEqual([data['data'] for data in self.test_data],
+                         self.published)
+        self.assertTrue(self.publishing_queue.empty())
+        self.assertEqual({}, self.test_publisher.unconfirmed)
+
+    def test_send_data_keeps_at_most_window_size_messages_unconfirmed(self) \
+            -> None:
+        self._queue_test_data()
+        unconfirmed_counts = []
+
+        def process_data_events(time_limit):
+            unconfirmed_counts.append(len(self.test_publisher.unconfirmed))
+            self._confirm_all()
+
+        self.rabbitmq.process_data_events.side_effect = process_data_events
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.assertEqual([2, 2, 1], unconfirmed_counts)
+
+    def test_send_data_confirms_multiple_messages_with_one_confirm(self) \
+            -> None:
+        self._queue_test_data()
+        self.rabbitmq.process_data_events.side_effect = \
+            lambda time_limit: self.test_publisher._on_confirm(
+                max(self.test_publisher.unconfirmed), True, True)
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.assertTrue(self.publishing_queue.empty())
+        self.assertEqual(3, self.rabbitmq.process_data_events.call_count)
+
+    def test_send_data_re_sends_nacked_data(self) -> None:
+        self._queue_test_data()
+        confirms = iter([False, True, True, True])
+        self.rabbitmq.process_data_events.side_effect = \
+            lambda time_limit: self._confirm_all(next(confirms))
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        expected_published = [data['data'] for data in self.test_data[:2]] * 2
+        expected_published += [data['data'] for data in self.test_data[2:]]
+        self.assertEqual(expected_published, self.published)
+        self.assertTrue(self.publishing_queue.empty())
+
+    def test_send_data_removes_acked_data_only_after_earlier_data_acked(
+            self) -> None:
+        self._queue_test_data()
+
+        def process_data_events(time_limit):
+            # Ack the second message only
+            self.rabbitmq.process_data_events.side_effect = None
+            self.test_publisher._on_confirm(2, False, True)
+
+        self.rabbitmq.process_data_events.side_effect = process_data_events
+        self.rabbitmq.process_data_events.return_value = -1
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.assertEqual(5, self.publishing_queue.qsize())
+        self.assertEqual(self.test_data, list(self.publishing_queue.queue))
+
+        self.rabbitmq.process_data_events.return_value = None
+        self.rabbitmq.process_data_events.side_effect = \
+            lambda time_limit: self._confirm_all()
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        # The second message is not sent again as it was already acked
+        self.assertEqual(self.test_data[1]['data'], self.published[1])
+        self.assertEqual(1, self.published.count(self.test_data[1]['data']))
+        self.assertTrue(self.publishing_queue.empty())
+
+    def test_send_data_raises_msg_not_delivered_exception_on_return(self) \
+            -> None:
+        self._queue_test_data()
+
+        def process_data_events(time_limit):
+            self.test_publisher._on_return(
+                'test_exchange', 'test_key', self.test_data[0]['data'].encode())
+            self._confirm_all()
+
+        self.rabbitmq.process_data_events.side_effect = process_data_events
+
+        self.assertRaises(MessageWasNotDeliveredException,
+                          self.test_publisher.send_data, self.publishing_queue)
+
+        # The returned data and the data after it stay in the queue, and the
+        # data after the returned data is not sent
+        self.assertEqual(self.test_data, list(self.publishing_queue.queue))
+        self.assertEqual(2, len(self.published))
+
+    def test_send_data_opens_pipelined_channel_if_not_open(self) -> None:
+        self.rabbitmq.is_pipelined_channel_open = False
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.rabbitmq.open_pipelined_channel.assert_called_once_with(
+            self.test_publisher._on_confirm, self.test_publisher._on_return)
+
+    def test_send_data_does_not_send_if_pipelined_channel_not_opened(self) \
+            -> None:
+        self._queue_test_data()
+        self.rabbitmq.is_pipelined_channel_open = False
+        self.rabbitmq.open_pipelined_channel.return_value = -1
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.rabbitmq.basic_publish_pipelined.assert_not_called()
+        self.assertEqual(5, self.publishing_queue.qsize())
+
+    def test_send_data_re_sends_unconfirmed_data_after_connection_error(
+            self) -> None:
+        self._queue_test_data()
+        self.rabbitmq.process_data_events.side_effect = \
+            pika.exceptions.AMQPConnectionError('test')
+
+        self.assertRaises(pika.exceptions.AMQPConnectionError,
+                          self.test_publisher.send_data, self.publishing_queue)
+        self.assertEqual(5, self.publishing_queue.qsize())
+        self.assertEqual({}, self.test_publisher.unconfirmed)
+
+        self.rabbitmq.process_data_events.side_effect = \
+            lambda time_limit: self._confirm_all()
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.assertEqual(7, len(self.published))
+        self.assertTrue(self.publishing_queue.empty())
+
+    def test_send_data_discards_incomplete_data(self) -> None:
+        self._queue_test_data()
+        del self.test_data[0]['routing_key']
+        self.rabbitmq.process_data_events.side_effect = \
+            lambda time_limit: self._confirm_all()
+
+        self.test_publisher.send_data(self.publishing_queue)
+
+        self.assertEqual([data['data'] for data in self.test_data[1:]],
+                         self.published)
+        self.assertTrue(self.publishing_queue.empty())
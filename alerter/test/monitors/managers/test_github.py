@@ -19,7 +19,10 @@ from src.monitors.managers.github import (GitHubMonitorsManager,
                                           GH_MON_MAN_INPUT_QUEUE,
                                           GH_MON_MAN_ROUTING_KEY_CHAINS,
                                           GH_MON_MAN_INPUT_ROUTING_KEY)
-from src.monitors.starters import start_github_monitor
+from src.monitors.multiplexer import (ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.monitors.starters import (start_github_monitor,
+                                   start_github_graphql_monitor)
 from src.utils import env
 from src.utils.constants import (GITHUB_MONITORS_MANAGER_CONFIGS_QUEUE_NAME,
                                  HEALTH_CHECK_EXCHANGE, CONFIG_EXCHANGE,
@@ -353,6 +356,79 @@ class TestGitHubMonitorsManager(unittest.TestCase):
         new_entry_process.terminate()
         new_entry_process.join()
 
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_monitor_process_adds_to_graphql_monitor(
+            self, mock_start) -> None:
+        mock_start.return_value = None
+        self.test_manager._use_graphql = True
+
+        self.test_manager._create_and_start_monitor_process(
+            self.repo_config_example, self.repo_id_new, self.chain_example_new)
+
+        # A single GraphQL monitor process must have been created and started
+        graphql_process = self.test_manager.graphql_monitor_process
+        mock_start.assert_called_once()
+        self.assertTrue(graphql_process.daemon)
+        self.assertEqual(start_github_graphql_monitor,
+                         graphql_process._target)
+        self.assertEqual(self.test_manager._graphql_monitor_commands,
+                         graphql_process._args[0])
+
+        # The monitor must have been added to the GraphQL monitor
+        command = self.test_manager._graphql_monitor_commands.get(timeout=1)
+        self.assertEqual(ADD_MONITOR_COMMAND, command['action'])
+        self.assertEqual(self.repo_id_new, command['config_id'])
+        self.assertEqual(self.repo_config_example.releases_page,
+                         command['repo_config'].releases_page)
+
+        expected_entry = {
+            'component_name': GITHUB_MONITOR_NAME_TEMPLATE.format(
+                self.repo_name_new.replace('/', ' ')[:-1]),
+            'process': graphql_process,
+            'chain': self.chain_example_new
+        }
+        self.assertEqual(
+            expected_entry,
+            self.test_manager.config_process_dict[self.repo_id_new])
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_monitor_process_reuses_live_graphql_monitor(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        self.test_manager._use_graphql = True
+
+        self.test_manager._create_and_start_monitor_process(
+            self.repo_config_example, self.repo_id_new, self.chain_example_new)
+        self.test_manager._create_and_start_monitor_process(
+            self.repo_config_example, 'config_id4', self.chain_example_new)
+
+        mock_start.assert_called_once()
+        self.assertEqual(
+            self.test_manager.config_process_dict[self.repo_id_new][
+                'process'],
+            self.test_manager.config_process_dict['config_id4']['process'])
+
+    @mock.patch.object(multiprocessing.Process, "join")
+    @mock.patch.object(multiprocessing.Process, "terminate")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_stop_monitor_only_removes_monitor_from_graphql_monitor(
+            self, mock_start, mock_terminate, mock_join) -> None:
+        mock_start.return_value = None
+        self.test_manager._use_graphql = True
+        self.test_manager._create_and_start_monitor_process(
+            self.repo_config_example, self.repo_id_new, self.chain_example_new)
+        self.test_manager._graphql_monitor_commands.get(timeout=1)
+
+        self.test_manager._stop_monitor(self.repo_id_new)
+
+        mock_terminate.assert_not_called()
+        mock_join.assert_not_called()
+        self.assertEqual(
+            {'action': REMOVE_MONITOR_COMMAND, 'config_id': self.repo_id_new},
+            self.test_manager._graphql_monitor_commands.get(timeout=1))
+
     @mock.patch.object(RabbitMQApi, "basic_ack")
     def test_process_configs_ignores_default_key(self, mock_ack) -> None:
         # This test will pass if the stored repos config does not change.
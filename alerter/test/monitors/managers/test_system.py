@@ -19,7 +19,10 @@ from src.monitors.managers.system import (SystemMonitorsManager,
                                           SYS_MON_MAN_INPUT_ROUTING_KEY,
                                           SYS_MON_MAN_ROUTING_KEY_CHAINS,
                                           SYS_MON_MAN_ROUTING_KEY_GEN)
-from src.monitors.starters import start_system_monitor
+from src.monitors.multiplexer import (ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.monitors.starters import (start_system_monitor,
+                                   start_system_monitors_multiplexer)
 from src.utils import env
 from src.utils.constants import (HEALTH_CHECK_EXCHANGE, CONFIG_EXCHANGE,
                                  SYSTEM_MONITORS_MANAGER_CONFIGS_QUEUE_NAME,
@@ -343,6 +346,119 @@ class TestSystemMonitorsManager(unittest.TestCase):
         self.assertEqual(self.system_config_example, new_entry_process._args[0])
         self.assertEqual(start_system_monitor, new_entry_process._target)
 
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_monitor_process_adds_to_multiplexer_if_multiplex(
+            self, mock_start) -> None:
+        mock_start.return_value = None
+        self.test_manager._multiplexed = True
+
+        self.test_manager._create_and_start_monitor_process(
+            self.system_config_example, self.system_id_new,
+            self.chain_example_new)
+
+        # A single multiplexer process must have been created and started
+        multiplexer_process = self.test_manager.multiplexer_process
+        mock_start.assert_called_once()
+        self.assertTrue(multiplexer_process.daemon)
+        self.assertEqual(start_system_monitors_multiplexer,
+                         multiplexer_process._target)
+        self.assertEqual(self.test_manager._multiplexer_commands,
+                         multiplexer_process._args[0])
+
+        # The monitor must have been added to the multiplexer
+        command = self.test_manager._multiplexer_commands.get(timeout=1)
+        self.assertEqual(ADD_MONITOR_COMMAND, command['action'])
+        self.assertEqual(self.system_id_new, command['config_id'])
+        self.assertEqual(self.system_config_example.node_exporter_url,
+                         command['system_config'].node_exporter_url)
+
+        expected_entry = {
+            'component_name': SYSTEM_MONITOR_NAME_TEMPLATE.format(
+                self.system_name_new),
+            'process': multiplexer_process,
+            'chain': self.chain_example_new
+        }
+        self.assertEqual(
+            expected_entry,
+            self.test_manager.config_process_dict[self.system_id_new])
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_monitor_process_reuses_a_live_multiplexer(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        self.test_manager._multiplexed = True
+
+        self.test_manager._create_and_start_monitor_process(
+            self.system_config_example, self.system_id_new,
+            self.chain_example_new)
+        self.test_manager._create_and_start_monitor_process(
+            self.system_config_example, 'config_id4', self.chain_example_new)
+
+        mock_start.assert_called_once()
+        self.assertEqual(
+            self.test_manager.config_process_dict[self.system_id_new][
+                'process'],
+            self.test_manager.config_process_dict['config_id4']['process'])
+
+    @mock.patch.object(multiprocessing.Process, "join")
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_monitor_process_restarts_a_dead_multiplexer(
+            self, mock_start, mock_is_alive, mock_join) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = False
+        mock_join.return_value = None
+        self.test_manager._multiplexed = True
+
+        self.test_manager._create_and_start_monitor_process(
+            self.system_config_example, self.system_id_new,
+            self.chain_example_new)
+        old_process = self.test_manager.multiplexer_process
+        self.test_manager._create_and_start_monitor_process(
+            self.system_config_example, self.system_id_new,
+            self.chain_example_new)
+
+        self.assertEqual(2, mock_start.call_count)
+        mock_join.assert_called_once()
+        self.assertNotEqual(old_process, self.test_manager.multiplexer_process)
+
+    @mock.patch.object(multiprocessing.Process, "join")
+    @mock.patch.object(multiprocessing.Process, "terminate")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_stop_monitor_only_removes_monitor_from_multiplexer(
+            self, mock_start, mock_terminate, mock_join) -> None:
+        mock_start.return_value = None
+        self.test_manager._multiplexed = True
+        self.test_manager._create_and_start_monitor_process(
+            self.system_config_example, self.system_id_new,
+            self.chain_example_new)
+        self.test_manager._multiplexer_commands.get(timeout=1)
+
+        self.test_manager._stop_monitor(self.system_id_new)
+
+        mock_terminate.assert_not_called()
+        mock_join.assert_not_called()
+        self.assertEqual(
+            {'action': REMOVE_MONITOR_COMMAND,
+             'config_id': self.system_id_new},
+            self.test_manager._multiplexer_commands.get(timeout=1))
+
+    @mock.patch.object(multiprocessing.Process, "join")
+    @mock.patch.object(multiprocessing.Process, "terminate")
+    def test_stop_monitor_terminates_the_process_if_not_multiplexed(
+            self, mock_terminate, mock_join) -> None:
+        mock_terminate.return_value = None
+        mock_join.return_value = None
+        self.test_manager._config_process_dict = \
+            self.config_process_dict_example
+
+        self.test_manager._stop_monitor('config_id1')
+
+        mock_terminate.assert_called_once()
+        mock_join.assert_called_once()
+
     @mock.patch("src.monitors.starters.create_logger")
     def test_create_and_start_monitor_process_starts_the_process(
             self, mock_create_logger) -> None:
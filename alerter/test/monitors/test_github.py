@@ -258,6 +258,46 @@ class TestGitHubMonitor(unittest.TestCase):
             self.retrieved_metrics_example)
         self.assertEqual(expected_output, actual_output)
 
+    @freeze_time("2012-01-01")
+    def test_process_retrieved_data_returns_unchanged_message_if_no_data(
+            self) -> None:
+        expected_output = {
+            'result': {
+                'meta_data': {
+                    'monitor_name': self.test_monitor.monitor_name,
+                    'repo_name': self.test_monitor.repo_config.repo_name,
+                    'repo_id': self.test_monitor.repo_config.repo_id,
+                    'repo_parent_id': self.test_monitor.repo_config.parent_id,
+                    'time': datetime(2012, 1, 1).timestamp()
+                },
+                'unchanged': True,
+            }
+        }
+        actual_output = self.test_monitor._process_retrieved_data(None)
+        self.assertEqual(expected_output, actual_output)
+
+    def test_etag_is_none_on_creation(self) -> None:
+        self.assertIsNone(self.test_monitor.etag)
+
+    @mock.patch("src.monitors.github.get_json_if_modified")
+    def test_get_data_sends_the_last_etag_and_stores_the_new_one(
+            self, mock_get_json_if_modified) -> None:
+        mock_get_json_if_modified.side_effect = [
+            (self.retrieved_metrics_example, '"etag_1"'),
+            (None, '"etag_1"'),
+        ]
+
+        first_data = self.test_monitor._get_data()
+        self.assertEqual('"etag_1"', self.test_monitor.etag)
+        second_data = self.test_monitor._get_data()
+
+        self.assertEqual(self.retrieved_metrics_example, first_data)
+        self.assertIsNone(second_data)
+        mock_get_json_if_modified.assert_has_calls([
+            mock.call(self.releases_page, self.dummy_logger, None),
+            mock.call(self.releases_page, self.dummy_logger, '"etag_1"'),
+        ])
+
     def test_send_data_sends_data_correctly(self) -> None:
         # This test creates a queue which receives messages with the same
         # routing key as the ones sent by send_data, and checks that the
@@ -0,0 +1,220 @@
+import logging
+import queue
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from freezegun import freeze_time
+from requests.exceptions import ConnectionError as ReqConnectionError
+
+from src.configs.repo import RepoConfig
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.github import GitHubMonitor
+from src.monitors.github_graphql import GitHubGraphQLMonitor
+from src.monitors.multiplexer import (ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.utils import env
+from src.utils.constants import (GITHUB_MONITOR_NAME_TEMPLATE,
+                                 GITHUB_GRAPHQL_API_URL)
+from src.utils.exceptions import (CannotAccessGitHubPageException,
+                                  GitHubAPICallException,
+                                  MessageWasNotDeliveredException)
+
+
+class TestGitHubGraphQLMonitor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.connection_check_time_interval = timedelta(seconds=0)
+        self.rabbitmq = RabbitMQApi(
+            self.dummy_logger, env.RABBIT_IP,
+            connection_check_time_interval=self.connection_check_time_interval)
+        self.monitor_name = 'test_github_graphql_monitor'
+        self.monitoring_period = 10
+        self.api_token = 'test_token'
+        self.batch_size = 2
+        # The monitor only reads from the queue without blocking, therefore a
+        # local queue is used so that commands are available immediately.
+        self.commands = queue.Queue()
+        self.repo_config_1 = RepoConfig(
+            'repo_id_1', 'parent_id', 'org/repo_1/', True,
+            env.GITHUB_RELEASES_TEMPLATE.format('org/repo_1/'))
+        self.repo_config_2 = RepoConfig(
+            'repo_id_2', 'parent_id', 'org/repo_2/', True,
+            env.GITHUB_RELEASES_TEMPLATE.format('org/repo_2/'))
+        self.repo_config_3 = RepoConfig(
+            'repo_id_3', 'parent_id', 'org/repo_3/', True,
+            env.GITHUB_RELEASES_TEMPLATE.format('org/repo_3/'))
+        self.test_monitor = GitHubGraphQLMonitor(
+            self.monitor_name, self.dummy_logger, self.monitoring_period,
+            self.rabbitmq, self.commands, self.api_token, self.batch_size)
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.rabbitmq = None
+        self.commands = None
+        self.test_monitor = None
+
+    def _add_monitors(self) -> None:
+        self.test_monitor._add_monitor('config_id_1', self.repo_config_1)
+        self.test_monitor._add_monitor('config_id_2', self.repo_config_2)
+        self.test_monitor._add_monitor('config_id_3', self.repo_config_3)
+
+    def test_str_returns_monitor_name(self) -> None:
+        self.assertEqual(self.monitor_name, str(self.test_monitor))
+
+    def test_batch_size_returns_batch_size(self) -> None:
+        self.assertEqual(self.batch_size, self.test_monitor.batch_size)
+
+    def test_process_commands_adds_and_removes_monitors(self) -> None:
+        self.commands.put({'action': ADD_MONITOR_COMMAND,
+                           'config_id': 'config_id_1',
+                           'repo_config': self.repo_config_1})
+        self.commands.put({'action': ADD_MONITOR_COMMAND,
+                           'config_id': 'config_id_2',
+                           'repo_config': self.repo_config_2})
+        self.commands.put({'action': REMOVE_MONITOR_COMMAND,
+                           'config_id': 'config_id_1'})
+
+        self.test_monitor._process_commands()
+
+        monitors = self.test_monitor.monitors
+        self.assertEqual({'config_id_2'}, set(monitors))
+        self.assertEqual(GITHUB_MONITOR_NAME_TEMPLATE.format('org repo_2'),
+                         monitors['config_id_2'].monitor_name)
+        self.assertEqual(self.repo_config_2.releases_page,
+                         monitors['config_id_2'].repo_config.releases_page)
+        self.assertIs(self.rabbitmq, monitors['config_id_2'].rabbitmq)
+
+    def test_build_query_queries_every_repo_under_an_alias(self) -> None:
+        self._add_monitors()
+
+        query = self.test_monitor._build_query(
+            list(self.test_monitor.monitors.values()))
+
+        self.assertIn('r0: repository(owner: "org", name: "repo_1")', query)
+        self.assertIn('r1: repository(owner: "org", name: "repo_2")', query)
+        self.assertIn('r2: repository(owner: "org", name: "repo_3")', query)
+        self.assertEqual(3, query.count('nodes { name tagName }'))
+
+    @mock.patch.object(GitHubGraphQLMonitor, "_get_data")
+    def test_retrieve_batch_returns_releases_in_rest_format(
+            self, mock_get_data) -> None:
+        mock_get_data.return_value = {
+            'data': {
+                'r0': {'releases': {'nodes': [
+                    {'name': 'Second Release', 'tagName': 'v2.0.0'},
+                    {'name': 'First Release', 'tagName': 'v1.0.0'},
+                ]}},
+                'r1': None,
+            },
+            'errors': [{
+                'type': 'NOT_FOUND', 'path': ['r1'],
+                'message': "Could not resolve to a Repository with the name "
+                           "'org/repo_2'."
+            }]
+        }
+        self._add_monitors()
+        monitors = list(self.test_monitor.monitors.values())[:2]
+
+        retrieved_data = self.test_monitor._retrieve_batch(monitors)
+
+        self.assertEqual(([{'name': 'Second Release', 'tag_name': 'v2.0.0'},
+                           {'name': 'First Release', 'tag_name': 'v1.0.0'}],
+                          False, None), retrieved_data[0])
+        data, data_retrieval_failed, exception = retrieved_data[1]
+        self.assertIsNone(data)
+        self.assertTrue(data_retrieval_failed)
+        self.assertIsInstance(exception, GitHubAPICallException)
+        self.assertIn("Could not resolve", exception.message)
+
+    @mock.patch.object(GitHubGraphQLMonitor, "_get_data")
+    def test_retrieve_batch_fails_every_repo_if_api_returns_error(
+            self, mock_get_data) -> None:
+        mock_get_data.return_value = {'message': 'Bad credentials'}
+        self._add_monitors()
+        monitors = list(self.test_monitor.monitors.values())
+
+        retrieved_data = self.test_monitor._retrieve_batch(monitors)
+
+        self.assertEqual(3, len(retrieved_data))
+        for data, data_retrieval_failed, exception in retrieved_data:
+            self.assertIsNone(data)
+            self.assertTrue(data_retrieval_failed)
+            self.assertEqual(
+                GitHubAPICallException('Bad credentials').message,
+                exception.message)
+
+    @mock.patch.object(GitHubGraphQLMonitor, "_get_data")
+    def test_retrieve_batch_fails_every_repo_if_api_cannot_be_accessed(
+            self, mock_get_data) -> None:
+        mock_get_data.side_effect = ReqConnectionError('test')
+        self._add_monitors()
+        monitors = list(self.test_monitor.monitors.values())
+
+        retrieved_data = self.test_monitor._retrieve_batch(monitors)
+
+        for data, data_retrieval_failed, exception in retrieved_data:
+            self.assertIsNone(data)
+            self.assertTrue(data_retrieval_failed)
+            expected_exception = CannotAccessGitHubPageException(
+                GITHUB_GRAPHQL_API_URL)
+            self.assertEqual(expected_exception.message, exception.message)
+            self.assertEqual(expected_exception.code, exception.code)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(GitHubGraphQLMonitor, "_send_heartbeat")
+    @mock.patch.object(GitHubMonitor, "_process_and_send_data",
+                       autospec=True)
+    @mock.patch.object(GitHubGraphQLMonitor, "_retrieve_batch")
+    def test_monitor_retrieves_in_batches_and_fans_out_to_each_repo(
+            self, mock_retrieve_batch, mock_process_and_send,
+            mock_send_hb) -> None:
+        mock_retrieve_batch.side_effect = lambda batch: [
+            ([{'name': monitor.repo_config.repo_name, 'tag_name': 'v1'}],
+             False, None) for monitor in batch]
+        mock_process_and_send.return_value = None
+        mock_send_hb.return_value = None
+        self._add_monitors()
+        monitors = self.test_monitor.monitors
+
+        self.test_monitor._monitor()
+
+        self.assertEqual(
+            [mock.call([monitors['config_id_1'], monitors['config_id_2']]),
+             mock.call([monitors['config_id_3']])],
+            mock_retrieve_batch.call_args_list)
+        mock_process_and_send.assert_has_calls([
+            mock.call(monitors['config_id_1'],
+                      [{'name': 'org/repo_1/', 'tag_name': 'v1'}], False,
+                      None),
+            mock.call(monitors['config_id_2'],
+                      [{'name': 'org/repo_2/', 'tag_name': 'v1'}], False,
+                      None),
+            mock.call(monitors['config_id_3'],
+                      [{'name': 'org/repo_3/', 'tag_name': 'v1'}], False,
+                      None),
+        ])
+        mock_send_hb.assert_called_once_with({
+            'component_name': self.monitor_name,
+            'is_alive': True,
+            'timestamp': datetime(2012, 1, 1).timestamp()
+        })
+
+    @mock.patch.object(GitHubGraphQLMonitor, "_send_heartbeat")
+    @mock.patch.object(GitHubMonitor, "_process_and_send_data")
+    @mock.patch.object(GitHubGraphQLMonitor, "_retrieve_batch")
+    def test_monitor_continues_if_a_message_is_not_delivered(
+            self, mock_retrieve_batch, mock_process_and_send,
+            mock_send_hb) -> None:
+        mock_retrieve_batch.side_effect = lambda batch: [
+            ([], False, None)] * len(batch)
+        mock_process_and_send.side_effect = [
+            MessageWasNotDeliveredException('test'), None, None]
+        mock_send_hb.return_value = None
+        self._add_monitors()
+
+        self.test_monitor._monitor()
+
+        self.assertEqual(3, mock_process_and_send.call_count)
+        mock_send_hb.assert_called_once()
@@ -0,0 +1,219 @@
+import logging
+import multiprocessing
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from freezegun import freeze_time
+
+from src.configs.system import SystemConfig
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.multiplexer import (SystemMonitorsMultiplexer,
+                                      ADD_MONITOR_COMMAND,
+                                      REMOVE_MONITOR_COMMAND)
+from src.monitors.system import SystemMonitor
+from src.utils import env
+from src.utils.constants import SYSTEM_MONITOR_NAME_TEMPLATE
+from src.utils.exceptions import (MessageWasNotDeliveredException,
+                                  SystemIsDownException)
+
+
+class TestSystemMonitorsMultiplexer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.connection_check_time_interval = timedelta(seconds=0)
+        self.rabbitmq = RabbitMQApi(
+            self.dummy_logger, env.RABBIT_IP,
+            connection_check_time_interval=self.connection_check_time_interval)
+        self.multiplexer_name = 'test_multiplexer'
+        self.monitoring_period = 10
+        self.max_concurrent_scrapes = 5
+        self.commands = multiprocessing.Queue()
+        self.system_config_1 = SystemConfig('system_id_1', 'parent_id',
+                                            'system_1', True, 'url_1')
+        self.system_config_2 = SystemConfig('system_id_2', 'parent_id',
+                                            'system_2', True, 'url_2')
+        self.test_multiplexer = SystemMonitorsMultiplexer(
+            self.multiplexer_name, self.dummy_logger, self.monitoring_period,
+            self.rabbitmq, self.commands, self.max_concurrent_scrapes)
+
+    def tearDown(self) -> None:
+        self.test_multiplexer._executor.shutdown(wait=True)
+        self.test_multiplexer._loop.close()
+        self.commands.close()
+        self.dummy_logger = None
+        self.rabbitmq = None
+        self.commands = None
+        self.test_multiplexer = None
+
+    def _send_command(self, command: dict) -> None:
+        self.commands.put(command)
+        # Wait for the feeder thread so that get_nowait sees the command
+        while self.commands.empty():
+            pass
+
+    def test_str_returns_multiplexer_name(self) -> None:
+        self.assertEqual(self.multiplexer_name, str(self.test_multiplexer))
+
+    def test_monitor_period_returns_monitor_period(self) -> None:
+        self.assertEqual(self.monitoring_period,
+                         self.test_multiplexer.monitor_period)
+
+    def test_monitors_is_empty_on_creation(self) -> None:
+        self.assertEqual({}, self.test_multiplexer.monitors)
+
+    def test_process_commands_adds_monitors_sharing_the_connection(self) \
+            -> None:
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_1',
+                            'system_config': self.system_config_1})
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_2',
+                            'system_config': self.system_config_2})
+
+        self.test_multiplexer._process_commands()
+
+        monitors = self.test_multiplexer.monitors
+        self.assertEqual({'config_id_1', 'config_id_2'}, set(monitors))
+        self.assertEqual(
+            self.system_config_1.node_exporter_url,
+            monitors['config_id_1'].system_config.node_exporter_url)
+        self.assertEqual(SYSTEM_MONITOR_NAME_TEMPLATE.format('system_1'),
+                         monitors['config_id_1'].monitor_name)
+        self.assertEqual(self.monitoring_period,
+                         monitors['config_id_1'].monitor_period)
+        for monitor in monitors.values():
+            self.assertIs(self.rabbitmq, monitor.rabbitmq)
+
+    def test_process_commands_replaces_a_monitor_which_is_added_again(self) \
+            -> None:
+        new_config = SystemConfig('system_id_1', 'parent_id', 'new_name', True,
+                                  'new_url')
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_1',
+                            'system_config': self.system_config_1})
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_1',
+                            'system_config': new_config})
+
+        self.test_multiplexer._process_commands()
+
+        self.assertEqual(1, len(self.test_multiplexer.monitors))
+        monitor = self.test_multiplexer.monitors['config_id_1']
+        self.assertEqual(new_config.system_name,
+                         monitor.system_config.system_name)
+        self.assertEqual(new_config.node_exporter_url,
+                         monitor.system_config.node_exporter_url)
+
+    def test_process_commands_removes_monitors(self) -> None:
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_1',
+                            'system_config': self.system_config_1})
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_2',
+                            'system_config': self.system_config_2})
+        self._send_command({'action': REMOVE_MONITOR_COMMAND,
+                            'config_id': 'config_id_1'})
+        self._send_command({'action': REMOVE_MONITOR_COMMAND,
+                            'config_id': 'non_existent_config_id'})
+
+        self.test_multiplexer._process_commands()
+
+        self.assertEqual({'config_id_2'},
+                         set(self.test_multiplexer.monitors))
+
+    def test_process_commands_does_nothing_if_no_commands(self) -> None:
+        self.test_multiplexer._process_commands()
+        self.assertEqual({}, self.test_multiplexer.monitors)
+
+    def _add_monitors(self) -> None:
+        self.test_multiplexer._add_monitor('config_id_1', self.system_config_1)
+        self.test_multiplexer._add_monitor('config_id_2', self.system_config_2)
+
+    @mock.patch.object(SystemMonitor, "_retrieve_data")
+    def test_retrieve_all_data_scrapes_concurrently(
+            self, mock_retrieve_data) -> None:
+        # Both retrievals must be running at the same time for the barrier to
+        # be passed, otherwise a BrokenBarrierError is raised.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def retrieve_data():
+            barrier.wait()
+            return {'metric': 1}, False, None
+
+        mock_retrieve_data.side_effect = retrieve_data
+        self._add_monitors()
+        monitors = list(self.test_multiplexer.monitors.values())
+
+        ret = self.test_multiplexer._loop.run_until_complete(
+            self.test_multiplexer._retrieve_all_data(monitors))
+
+        self.assertEqual([({'metric': 1}, False, None),
+                          ({'metric': 1}, False, None)], ret)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(SystemMonitorsMultiplexer, "_send_heartbeat")
+    @mock.patch.object(SystemMonitor, "_process_and_send_data", autospec=True)
+    @mock.patch.object(SystemMonitor, "_retrieve_data", autospec=True)
+    def test_monitor_processes_the_data_of_every_monitor(
+            self, mock_retrieve_data, mock_process_and_send,
+            mock_send_hb) -> None:
+        error = SystemIsDownException('system_2')
+        retrieved = {
+            'url_1': ({'metric': 1}, False, None),
+            'url_2': (None, True, error),
+        }
+        mock_retrieve_data.side_effect = \
+            lambda monitor: retrieved[monitor.system_config.node_exporter_url]
+        mock_process_and_send.return_value = None
+        mock_send_hb.return_value = None
+        self._add_monitors()
+        monitors = self.test_multiplexer.monitors
+
+        self.test_multiplexer._monitor()
+
+        mock_process_and_send.assert_has_calls([
+            mock.call(monitors['config_id_1'], {'metric': 1}, False, None),
+            mock.call(monitors['config_id_2'], None, True, error)
+        ])
+        mock_send_hb.assert_called_once_with({
+            'component_name': self.multiplexer_name,
+            'is_alive': True,
+            'timestamp': datetime(2012, 1, 1).timestamp()
+        })
+
+    @mock.patch.object(SystemMonitorsMultiplexer, "_send_heartbeat")
+    @mock.patch.object(SystemMonitor, "_process_and_send_data")
+    @mock.patch.object(SystemMonitor, "_retrieve_data")
+    def test_monitor_continues_if_a_message_is_not_delivered(
+            self, mock_retrieve_data, mock_process_and_send,
+            mock_send_hb) -> None:
+        mock_retrieve_data.return_value = ({'metric': 1}, False, None)
+        mock_process_and_send.side_effect = [
+            MessageWasNotDeliveredException('test'), None]
+        mock_send_hb.return_value = None
+        self._add_monitors()
+
+        self.test_multiplexer._monitor()
+
+        self.assertEqual(2, mock_process_and_send.call_count)
+        mock_send_hb.assert_called_once()
+
+    @mock.patch.object(SystemMonitorsMultiplexer, "_send_heartbeat")
+    @mock.patch.object(SystemMonitor, "_retrieve_data")
+    def test_monitor_applies_commands_before_monitoring(
+            self, mock_retrieve_data, mock_send_hb) -> None:
+        mock_retrieve_data.return_value = (None, False, None)
+        mock_send_hb.return_value = None
+        self._send_command({'action': ADD_MONITOR_COMMAND,
+                            'config_id': 'config_id_1',
+                            'system_config': self.system_config_1})
+
+        with mock.patch.object(SystemMonitor,
+                               "_process_and_send_data") as mock_process:
+            self.test_multiplexer._monitor()
+            mock_process.assert_called_once_with(None, False, None)
+
+        self.assertEqual({'config_id_1'}, set(self.test_multiplexer.monitors))
@@ -0,0 +1,236 @@
+import json
+import logging
+import unittest
+from unittest import mock
+
+from parameterized import parameterized
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.utils.data import (parse_prometheus_metrics,
+                            get_prometheus_metrics_data, get_json_if_modified)
+from src.utils.exceptions import (NoMetricsGivenException,
+                                  MetricNotFoundException)
+
+EXPOSITION = '''# HELP go_goroutines Number of goroutines that currently exist.
+# TYPE go_goroutines gauge
+go_goroutines 8
+# HELP node_cpu_seconds_total Seconds the cpus spent in each mode.
+# TYPE node_cpu_seconds_total counter
+node_cpu_seconds_total{cpu="0",mode="idle"} 1.234567e+06
+node_cpu_seconds_total{cpu="0",mode="user"} 5214.3
+node_cpu_seconds_total{cpu="1",mode="idle"} 1.23456e+06
+node_cpu_seconds_total{cpu="1",mode="user"} 5100.25
+# HELP node_filesystem_avail_bytes Filesystem space available.
+# TYPE node_filesystem_avail_bytes gauge
+node_filesystem_avail_bytes{device="/dev/sda1",fstype="ext4",\
+mountpoint="/"} 2.5e+10
+node_filesystem_avail_bytes{device="tmpfs",fstype="tmpfs",\
+mountpoint="/run \\"quoted\\" \\\\ dir"} 1.6e+08
+# HELP node_load1 1m load average.
+# TYPE node_load1 gauge
+node_load1 0.52
+# HELP node_memory_MemTotal_bytes Memory information field MemTotal_bytes.
+# TYPE node_memory_MemTotal_bytes gauge
+node_memory_MemTotal_bytes 8.25e+09
+# HELP node_network_receive_bytes_total Network device statistic.
+# TYPE node_network_receive_bytes_total counter
+node_network_receive_bytes_total{device="eth0"} 9.8e+08
+node_network_receive_bytes_total{device="lo"} 1234
+# HELP process_cpu_seconds_total Total user and system CPU time spent.
+# TYPE process_cpu_seconds_total counter
+process_cpu_seconds_total 12.5
+process_cpu_seconds_total 2.5 1612345678000
+# HELP process_max_fds Maximum number of open file descriptors.
+# TYPE process_max_fds gauge
+process_max_fds +Inf
+'''
+
+
+def _reference_parse(text: str, requested_metrics: list) -> dict:
+    # The parsing previously done by get_prometheus_metrics_data
+    response = {}
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if sample.name not in requested_metrics:
+                continue
+            if sample.labels != {}:
+                if sample.name not in response:
+                    response[sample.name] = {}
+                response[sample.name][json.dumps(sample.labels)] = \
+                    sample.value
+            elif sample.name not in response:
+                response[sample.name] = sample.value
+            else:
+                response[sample.name] = sample.value + response[sample.name]
+    return response
+
+
+class TestParsePrometheusMetrics(unittest.TestCase):
+    @parameterized.expand([
+        (['node_load1'],),
+        (['go_goroutines', 'node_cpu_seconds_total'],),
+        (['node_filesystem_avail_bytes', 'node_memory_MemTotal_bytes'],),
+        (['node_network_receive_bytes_total', 'process_cpu_seconds_total',
+          'process_max_fds'],),
+        (['node_load1', 'go_goroutines', 'process_max_fds'],),
+    ])
+    def test_parse_returns_same_result_as_prometheus_client(
+            self, requested_metrics) -> None:
+        expected = _reference_parse(EXPOSITION, requested_metrics)
+
+        actual = parse_prometheus_metrics(EXPOSITION.splitlines(),
+                                          requested_metrics)
+
+        self.assertEqual(expected, actual)
+
+    def test_parse_unescapes_label_values(self) -> None:
+        actual = parse_prometheus_metrics(EXPOSITION.splitlines(),
+                                          ['node_filesystem_avail_bytes'])
+
+        labels = [json.loads(key) for key in
+                  actual['node_filesystem_avail_bytes']]
+        self.assertEqual('/run "quoted" \\ dir', labels[1]['mountpoint'])
+
+    def test_parse_sums_the_values_of_unlabelled_samples(self) -> None:
+        actual = parse_prometheus_metrics(EXPOSITION.splitlines(),
+                                          ['process_cpu_seconds_total'])
+
+        self.assertEqual({'process_cpu_seconds_total': 15.0}, actual)
+
+    def test_parse_stops_reading_once_all_metrics_are_seen(self) -> None:
+        lines = iter(EXPOSITION.splitlines())
+
+        actual = parse_prometheus_metrics(lines, ['go_goroutines',
+                                                  'node_load1'])
+
+        self.assertEqual({'go_goroutines': 8.0, 'node_load1': 0.52}, actual)
+        # Parsing stops at the HELP line of the next metric family
+        self.assertEqual('# TYPE node_memory_MemTotal_bytes gauge',
+                         next(lines))
+
+    def test_parse_does_not_return_metrics_which_are_not_found(self) -> None:
+        actual = parse_prometheus_metrics(EXPOSITION.splitlines(),
+                                          ['node_load1', 'node_load5'])
+
+        self.assertEqual({'node_load1': 0.52}, actual)
+
+    def test_parse_raises_value_error_if_labels_are_invalid(self) -> None:
+        self.assertRaises(ValueError, parse_prometheus_metrics,
+                          ['node_load1{device=eth0} 1'], ['node_load1'])
+
+
+class TestGetPrometheusMetricsData(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.endpoint = 'http://localhost:9100/metrics'
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_prometheus_metrics_data_streams_the_response(
+            self, mock_get_client) -> None:
+        mock_get = mock_get_client.return_value.get
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.iter_lines.return_value = [
+            line.encode('utf-8') for line in EXPOSITION.splitlines()]
+
+        actual = get_prometheus_metrics_data(
+            self.endpoint, ['node_load1', 'go_goroutines'], self.dummy_logger)
+
+        self.assertEqual({'node_load1': 0.52, 'go_goroutines': 8.0}, actual)
+        mock_get.assert_called_once_with(self.endpoint, self.dummy_logger,
+                                         timeout=10)
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_prometheus_metrics_data_raises_if_metric_not_found(
+            self, mock_get_client) -> None:
+        mock_get = mock_get_client.return_value.get
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.iter_lines.return_value = [
+            line.encode('utf-8') for line in EXPOSITION.splitlines()]
+
+        self.assertRaises(MetricNotFoundException,
+                          get_prometheus_metrics_data, self.endpoint,
+                          ['node_load1', 'node_load5'], self.dummy_logger)
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_prometheus_metrics_data_raises_if_no_metrics_given(
+            self, mock_get_client) -> None:
+        self.assertRaises(NoMetricsGivenException,
+                          get_prometheus_metrics_data, self.endpoint, [],
+                          self.dummy_logger)
+        mock_get_client.return_value.get.assert_not_called()
+
+
+class TestGetJsonIfModified(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.endpoint = 'https://api.github.com/repos/org/repo/releases'
+        self.etag = 'W/"31b5f7c4e8"'
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_json_if_modified_returns_json_and_etag_if_modified(
+            self, mock_get_client) -> None:
+        mock_get = mock_get_client.return_value.get
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"new_etag"'}
+        mock_response.content = b'[{"name": "v1.0.0"}]'
+
+        data, etag = get_json_if_modified(self.endpoint, self.dummy_logger,
+                                          self.etag)
+
+        self.assertEqual([{'name': 'v1.0.0'}], data)
+        self.assertEqual('"new_etag"', etag)
+        mock_get.assert_called_once_with(
+            self.endpoint, self.dummy_logger, timeout=15, params={},
+            headers={'If-None-Match': self.etag})
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_json_if_modified_returns_none_if_not_modified(
+            self, mock_get_client) -> None:
+        mock_get = mock_get_client.return_value.get
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.status_code = 304
+
+        data, etag = get_json_if_modified(self.endpoint, self.dummy_logger,
+                                          self.etag)
+
+        self.assertIsNone(data)
+        self.assertEqual(self.etag, etag)
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_json_if_modified_keeps_etag_on_error_response(
+            self, mock_get_client) -> None:
+        mock_get = mock_get_client.return_value.get
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.status_code = 403
+        mock_response.headers = {}
+        mock_response.content = b'{"message": "API rate limit exceeded"}'
+
+        data, etag = get_json_if_modified(self.endpoint, self.dummy_logger,
+                                          self.etag)
+
+        self.assertEqual({'message': 'API rate limit exceeded'}, data)
+        self.assertEqual(self.etag, etag)
+
+    @mock.patch("src.utils.data.get_shared_http_client")
+    def test_get_json_if_modified_sends_no_condition_without_etag(
+            self, mock_get_client) -> None:
+        mock_get = mock_get_client.return_value.get
+        mock_response = mock_get.return_value.__enter__.return_value
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"new_etag"'}
+        mock_response.content = b'[]'
+
+        get_json_if_modified(self.endpoint, self.dummy_logger, None)
+
+        mock_get.assert_called_once_with(
+            self.endpoint, self.dummy_logger, timeout=15, params={},
+            headers={})
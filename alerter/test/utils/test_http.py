@@ -0,0 +1,99 @@
+import logging
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.utils.constants import HTTP_MAX_DRAINED_BYTES
+from src.utils.http import HTTPClient, RequestTimings, get_shared_http_client
+
+SMALL_BODY = b'line\n' * 100
+LARGE_BODY = b'line\n' * (HTTP_MAX_DRAINED_BYTES // 2)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        body = LARGE_BODY if self.path == '/large' else SMALL_BODY
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestHTTPClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever,
+                                             daemon=True)
+        cls.server_thread.start()
+        cls.base_url = 'http://127.0.0.1:{}'.format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server_thread.join()
+
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_client = HTTPClient(max_hosts=2, max_connections_per_host=1)
+
+    def tearDown(self) -> None:
+        self.test_client.close()
+        self.dummy_logger = None
+        self.test_client = None
+
+    def _get(self, path: str, read_lines: int = None) -> RequestTimings:
+        url = self.base_url + path
+        with self.test_client.get(url, self.dummy_logger, 5) as response:
+            self.assertEqual(200, response.status_code)
+            if read_lines is None:
+                self.assertEqual(SMALL_BODY, response.content)
+            else:
+                lines = response.iter_lines()
+                for _ in range(read_lines):
+                    next(lines)
+        return self.test_client.last_timings[url]
+
+    def test_get_records_the_timings_of_the_request(self) -> None:
+        timings = self._get('/small')
+
+        self.assertGreater(timings.connect_time, 0)
+        self.assertGreaterEqual(timings.time_to_first_byte,
+                                timings.connect_time)
+        self.assertGreaterEqual(timings.transfer_time, 0)
+        self.assertEqual(timings.time_to_first_byte + timings.transfer_time,
+                         timings.total_time)
+        self.assertFalse(timings.reused_connection)
+
+    def test_get_reuses_the_connection_of_previous_requests(self) -> None:
+        self._get('/small')
+        timings = self._get('/small')
+
+        self.assertEqual(0, timings.connect_time)
+        self.assertTrue(timings.reused_connection)
+
+    def test_get_reuses_connection_if_small_body_is_partially_read(self) \
+            -> None:
+        self._get('/small', read_lines=1)
+        timings = self._get('/small')
+
+        self.assertTrue(timings.reused_connection)
+
+    def test_get_closes_connection_if_large_body_is_partially_read(self) \
+            -> None:
+        self._get('/large', read_lines=1)
+        timings = self._get('/small')
+
+        self.assertFalse(timings.reused_connection)
+
+    def test_get_shared_http_client_always_returns_the_same_client(self) \
+            -> None:
+        self.assertIs(get_shared_http_client(), get_shared_http_client())